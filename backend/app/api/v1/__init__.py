@@ -1,6 +1,18 @@
 """
 API v1 module
+
+Route modules are imported lazily on first access, so importing one
+router does not pull in every other router's dependencies.
 """
-from . import admin, auth, chat, conversations, documents, health
+import importlib
 
 __all__ = ["admin", "auth", "chat", "conversations", "documents", "health"]
+
+
+def __getattr__(name: str):
+    """Import route submodules on first attribute access (PEP 562)"""
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
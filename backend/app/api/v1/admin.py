@@ -6,13 +6,19 @@ Simple API key authentication for administrative operations:
 - Dispute document uploads
 - System statistics
 """
+import asyncio
+import hashlib
+import hmac
 import io
-import tempfile
-from pathlib import Path
-from typing import List, Optional
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 import yaml
-from fastapi import APIRouter, Depends, File, Header, HTTPException, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Response, UploadFile, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
 
 from app.core import get_logger, get_settings
@@ -20,13 +26,44 @@ from app.models import DocumentTemplate
 from app.services import DisputeService, DocumentService, TaxCodeService
 
 logger = get_logger(__name__)
-router = APIRouter()
+
+# Prefer the LibYAML-backed loader, falling back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YAML_LOADER
+except ImportError:
+    from yaml import SafeLoader as _YAML_LOADER
+
+# Parsed template cache keyed by content digest (re-uploads skip YAML parsing)
+_TEMPLATE_CACHE_MAX_SIZE = 512
+_template_parse_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_template_cache_stats = {"hits": 0, "misses": 0}
+# Parsing runs in the thread pool; guards the cache and its stats
+_template_cache_lock = threading.Lock()
+
+# Chunk size for reading uploaded files
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Number of error messages included in a dispute upload response
+_MAX_ERROR_SAMPLES = 3
+
+# Fields every uploaded template must define
+_REQUIRED_TEMPLATE_FIELDS = frozenset(
+    ("id", "type", "name_ka", "name_en", "language", "content", "variables")
+)
 
 # Global service instances (will be set from main.py)
 _tax_service: Optional[TaxCodeService] = None
 _dispute_service: Optional[DisputeService] = None
 _document_service: Optional[DocumentService] = None
 
+# Encoded admin API key, resolved once from settings
+_admin_key: Optional[bytes] = None
+_admin_key_loaded = False
+
+# Short-lived service status snapshots for /admin/stats: name -> (expires_at, status)
+_STATUS_CACHE_TTL_SECONDS = 2.0
+_status_cache: Dict[str, Tuple[float, dict]] = {}
+
 
 def set_services(
     tax_service: TaxCodeService,
@@ -38,6 +75,140 @@ def set_services(
     _tax_service = tax_service
     _dispute_service = dispute_service
     _document_service = document_service
+    _load_admin_key()
+    _invalidate_status_cache()
+
+
+def _load_admin_key() -> Optional[bytes]:
+    """Resolve and cache the encoded admin API key from settings"""
+    global _admin_key, _admin_key_loaded
+    admin_api_key = get_settings().admin_api_key
+    _admin_key = admin_api_key.encode() if admin_api_key else None
+    _admin_key_loaded = True
+    return _admin_key
+
+
+async def _cached_status(name: str, service: Optional[object]) -> Optional[dict]:
+    """
+    Get a service status, reusing a snapshot taken within the TTL
+
+    Fresh snapshots are taken in a worker thread so that several services
+    can be queried concurrently without blocking the event loop.
+
+    Args:
+        name: Cache key for the service
+        service: Service instance exposing get_status(), or None
+
+    Returns:
+        Service status dictionary, or None if the service is not set
+    """
+    if service is None:
+        return None
+
+    now = time.monotonic()
+    cached = _status_cache.get(name)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    service_status = await asyncio.to_thread(service.get_status)
+    _status_cache[name] = (now + _STATUS_CACHE_TTL_SECONDS, service_status)
+    return service_status
+
+
+def _invalidate_status_cache() -> None:
+    """Drop cached service statuses after content changes"""
+    _status_cache.clear()
+
+
+def _parse_template_yaml(stream: BinaryIO) -> dict:
+    """
+    Parse template YAML, reusing the result for identical content
+
+    The stream is hashed chunk by chunk and then handed to the loader
+    directly, so the upload is never materialized as a single buffer.
+
+    Args:
+        stream: Binary file object positioned anywhere (rewound before use)
+
+    Returns:
+        Parsed template data (shared with the cache, must not be mutated)
+
+    Raises:
+        yaml.YAMLError: If content is not valid YAML
+    """
+    stream.seek(0)
+    hasher = hashlib.blake2b(digest_size=16)
+    while chunk := stream.read(_UPLOAD_CHUNK_SIZE):
+        hasher.update(chunk)
+    digest = hasher.digest()
+
+    with _template_cache_lock:
+        template_data = _template_parse_cache.get(digest)
+        if template_data is not None:
+            _template_parse_cache.move_to_end(digest)
+            _template_cache_stats["hits"] += 1
+            return template_data
+        _template_cache_stats["misses"] += 1
+
+    # The binary stream goes straight to the loader: LibYAML reads it
+    # incrementally, detects the encoding and strips any BOM itself
+    stream.seek(0)
+    template_data = yaml.load(stream, Loader=_YAML_LOADER)
+
+    with _template_cache_lock:
+        _template_parse_cache[digest] = template_data
+        if len(_template_parse_cache) > _TEMPLATE_CACHE_MAX_SIZE:
+            _template_parse_cache.popitem(last=False)
+
+    return template_data
+
+
+def get_template_cache_stats() -> dict:
+    """Get parsed template cache statistics"""
+    return {
+        **_template_cache_stats,
+        "size": len(_template_parse_cache),
+        "max_size": _TEMPLATE_CACHE_MAX_SIZE,
+    }
+
+
+async def _import_dispute_pdf(file: UploadFile) -> Optional[str]:
+    """
+    Import dispute decisions from a PDF file
+
+    Args:
+        file: Uploaded PDF
+
+    Returns:
+        Error message if the file could not be fully processed, None otherwise
+    """
+    # PDF processing would go here
+    # For now, log that it's not fully implemented
+    logger.warning("PDF processing not fully implemented: %s", file.filename)
+    return "PDF processing not fully implemented"
+
+
+async def _import_dispute_json(file: UploadFile) -> Optional[str]:
+    """
+    Import structured dispute data from a JSON file
+
+    Args:
+        file: Uploaded JSON
+
+    Returns:
+        Error message if the file could not be fully processed, None otherwise
+    """
+    # JSON dispute import would go here
+    # For now, log that it's not fully implemented
+    logger.warning("JSON import not fully implemented: %s", file.filename)
+    return "JSON import not fully implemented"
+
+
+# Dispute import handlers by file extension
+_DISPUTE_HANDLERS = {
+    ".pdf": _import_dispute_pdf,
+    ".json": _import_dispute_json,
+}
 
 
 # ============================================================================
@@ -55,9 +226,9 @@ def verify_admin_key(x_admin_key: str = Header(None)):
     Raises:
         HTTPException: 401 if key is missing or invalid
     """
-    settings = get_settings()
+    admin_key = _admin_key if _admin_key_loaded else _load_admin_key()
 
-    if not settings.admin_api_key:
+    if not admin_key:
         logger.error("ADMIN_API_KEY not configured in environment")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -70,7 +241,8 @@ def verify_admin_key(x_admin_key: str = Header(None)):
             detail="Missing X-Admin-Key header"
         )
 
-    if x_admin_key != settings.admin_api_key:
+    # Constant-time comparison to avoid leaking the key through response timing
+    if not hmac.compare_digest(x_admin_key.encode(), admin_key):
         logger.warning("Invalid admin API key attempt")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -80,6 +252,10 @@ def verify_admin_key(x_admin_key: str = Header(None)):
     return True
 
 
+# All admin endpoints share the key check, resolved once at the router level
+router = APIRouter(prefix="/admin", dependencies=[Depends(verify_admin_key)])
+
+
 # ============================================================================
 # Request/Response Models
 # ============================================================================
@@ -103,7 +279,13 @@ class DisputeUploadResponse(BaseModel):
 
 
 class ServiceStats(BaseModel):
-    """Service statistics"""
+    """
+    Service statistics
+
+    Built only from server-side status data, so it is created with
+    model_construct() to skip validation. Never construct it that way
+    from client input.
+    """
 
     status: str
     ready: bool
@@ -111,7 +293,7 @@ class ServiceStats(BaseModel):
 
 
 class AdminStatsResponse(BaseModel):
-    """Admin statistics response"""
+    """Admin statistics response (server-built, see ServiceStats)"""
 
     tax_service: ServiceStats
     dispute_service: ServiceStats
@@ -125,11 +307,8 @@ class AdminStatsResponse(BaseModel):
 # ============================================================================
 
 
-@router.post("/admin/templates", response_model=TemplateUploadResponse)
-async def upload_template(
-    file: UploadFile = File(...),
-    _: bool = Depends(verify_admin_key)
-):
+@router.post("/templates", response_model=TemplateUploadResponse)
+async def upload_template(file: UploadFile = File(...)):
     """
     Upload a new document template
 
@@ -137,7 +316,6 @@ async def upload_template(
 
     Args:
         file: YAML template file
-        _: Admin key verification (dependency)
 
     Returns:
         Template upload result with ID and status
@@ -156,18 +334,17 @@ async def upload_template(
         )
 
     try:
-        # Read and parse YAML
-        content = await file.read()
-        template_data = yaml.safe_load(content)
+        # Parse YAML straight from the spooled upload
+        # Hashing and parsing read the spooled file, which may be on disk
+        template_data = await run_in_threadpool(_parse_template_yaml, file.file)
 
         # Validate required fields
-        required_fields = ["id", "type", "name_ka", "name_en", "language", "content", "variables"]
-        missing_fields = [f for f in required_fields if f not in template_data]
+        missing_fields = _REQUIRED_TEMPLATE_FIELDS.difference(template_data)
 
         if missing_fields:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Missing required fields: {', '.join(missing_fields)}"
+                detail=f"Missing required fields: {', '.join(sorted(missing_fields))}"
             )
 
         # Create DocumentTemplate instance
@@ -175,9 +352,10 @@ async def upload_template(
 
         # Add template to store
         template_id = await _document_service.template_store.add_template(template)
+        _invalidate_status_cache()
 
         logger.info(
-            f"Template uploaded successfully: {template_id}",
+            "Template uploaded successfully: %s", template_id,
             extra={"template_id": template_id, "filename": file.filename}
         )
 
@@ -187,31 +365,30 @@ async def upload_template(
             message=f"Template '{template_id}' created successfully"
         )
 
+    except HTTPException:
+        raise
     except yaml.YAMLError as e:
-        logger.error(f"Invalid YAML file: {e}")
+        logger.error("Invalid YAML file: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Invalid YAML format: {str(e)}"
         )
     except ValueError as e:
-        logger.error(f"Template validation error: {e}")
+        logger.error("Template validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Template validation failed: {str(e)}"
         )
     except Exception as e:
-        logger.error(f"Error uploading template: {e}", exc_info=True)
+        logger.exception("Error uploading template: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to upload template: {str(e)}"
         )
 
 
-@router.post("/admin/disputes", response_model=DisputeUploadResponse)
-async def upload_disputes(
-    files: List[UploadFile] = File(...),
-    _: bool = Depends(verify_admin_key)
-):
+@router.post("/disputes", response_model=DisputeUploadResponse)
+async def upload_disputes(files: List[UploadFile] = File(...)):
     """
     Upload dispute documents for processing
 
@@ -223,7 +400,6 @@ async def upload_disputes(
 
     Args:
         files: List of PDF or JSON files
-        _: Admin key verification (dependency)
 
     Returns:
         Upload result with document and chunk counts
@@ -236,66 +412,57 @@ async def upload_disputes(
 
     documents_processed = 0
     total_chunks = 0
-    errors = []
+    error_count = 0
+    error_samples: List[str] = []
+
+    def add_error(message: str) -> None:
+        nonlocal error_count
+        error_count += 1
+        if len(error_samples) < _MAX_ERROR_SAMPLES:
+            error_samples.append(message)
 
     try:
-        # Create temporary directory for file processing
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-
-            for file in files:
-                try:
-                    # Validate file type
-                    if not file.filename.endswith(('.pdf', '.json')):
-                        errors.append(f"{file.filename}: Unsupported format (use .pdf or .json)")
-                        continue
-
-                    # Save file temporarily
-                    file_path = temp_path / file.filename
-                    content = await file.read()
-
-                    with open(file_path, 'wb') as f:
-                        f.write(content)
-
-                    # Process based on file type
-                    if file.filename.endswith('.pdf'):
-                        # PDF processing would go here
-                        # For now, log that it's not fully implemented
-                        logger.warning(f"PDF processing not fully implemented: {file.filename}")
-                        errors.append(f"{file.filename}: PDF processing not fully implemented")
-
-                    elif file.filename.endswith('.json'):
-                        # JSON dispute import would go here
-                        # For now, log that it's not fully implemented
-                        logger.warning(f"JSON import not fully implemented: {file.filename}")
-                        errors.append(f"{file.filename}: JSON import not fully implemented")
-
-                    documents_processed += 1
-
-                except Exception as e:
-                    logger.error(f"Error processing {file.filename}: {e}")
-                    errors.append(f"{file.filename}: {str(e)}")
+        for file in files:
+            try:
+                # Validate file type
+                handler = _DISPUTE_HANDLERS.get(os.path.splitext(file.filename)[1].lower())
+                if handler is None:
+                    add_error(f"{file.filename}: Unsupported format (use .pdf or .json)")
+                    continue
+
+                # Process based on file type
+                error = await handler(file)
+                if error:
+                    add_error(f"{file.filename}: {error}")
+
+                documents_processed += 1
+
+            except Exception as e:
+                logger.error("Error processing %s: %s", file.filename, e)
+                add_error(f"{file.filename}: {str(e)}")
+
+        _invalidate_status_cache()
 
         # Determine status
         if documents_processed == 0:
             status_text = "failed"
             message = "No documents processed successfully"
-        elif errors:
+        elif error_count:
             status_text = "partial"
-            message = f"Processed {documents_processed} documents with {len(errors)} errors"
+            message = f"Processed {documents_processed} documents with {error_count} errors"
         else:
             status_text = "success"
             message = f"Successfully processed {documents_processed} documents"
 
-        if errors:
-            message += f". Errors: {'; '.join(errors[:3])}"  # Limit to first 3 errors
+        if error_samples:
+            message += f". Errors: {'; '.join(error_samples)}"
 
         logger.info(
-            f"Dispute upload completed: {documents_processed} processed, {len(errors)} errors",
+            "Dispute upload completed: %d processed, %d errors", documents_processed, error_count,
             extra={
                 "documents_processed": documents_processed,
                 "total_chunks": total_chunks,
-                "error_count": len(errors)
+                "error_count": error_count
             }
         )
 
@@ -307,15 +474,15 @@ async def upload_disputes(
         )
 
     except Exception as e:
-        logger.error(f"Error in dispute upload: {e}", exc_info=True)
+        logger.exception("Error in dispute upload: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to process disputes: {str(e)}"
         )
 
 
-@router.get("/admin/stats", response_model=AdminStatsResponse)
-async def get_admin_stats(_: bool = Depends(verify_admin_key)):
+@router.get("/stats", response_model=AdminStatsResponse)
+async def get_admin_stats():
     """
     Get system statistics
 
@@ -329,10 +496,16 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
         - Vector store statistics
     """
     try:
+        # Snapshot all service statuses concurrently
+        tax_status, dispute_status, doc_status = await asyncio.gather(
+            _cached_status("tax", _tax_service),
+            _cached_status("dispute", _dispute_service),
+            _cached_status("document", _document_service),
+        )
+
         # Tax service stats
-        if _tax_service:
-            tax_status = _tax_service.get_status()
-            tax_stats = ServiceStats(
+        if tax_status is not None:
+            tax_stats = ServiceStats.model_construct(
                 status="ready" if tax_status.get("ready") else "not_ready",
                 ready=tax_status.get("ready", False),
                 details={
@@ -342,16 +515,15 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
                 }
             )
         else:
-            tax_stats = ServiceStats(
+            tax_stats = ServiceStats.model_construct(
                 status="unavailable",
                 ready=False,
                 details={}
             )
 
         # Dispute service stats
-        if _dispute_service:
-            dispute_status = _dispute_service.get_status()
-            dispute_stats = ServiceStats(
+        if dispute_status is not None:
+            dispute_stats = ServiceStats.model_construct(
                 status="ready" if dispute_status.get("ready") else "not_ready",
                 ready=dispute_status.get("ready", False),
                 details=dispute_status
@@ -364,7 +536,7 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
                 "index_size": dispute_status.get("index_size", 0)
             }
         else:
-            dispute_stats = ServiceStats(
+            dispute_stats = ServiceStats.model_construct(
                 status="unavailable",
                 ready=False,
                 details={}
@@ -375,9 +547,8 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
             }
 
         # Document service stats
-        if _document_service:
-            doc_status = _document_service.get_status()
-            document_stats = ServiceStats(
+        if doc_status is not None:
+            document_stats = ServiceStats.model_construct(
                 status="ready" if doc_status.get("ready") else "not_ready",
                 ready=doc_status.get("ready", False),
                 details=doc_status
@@ -388,18 +559,16 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
             templates_info = {
                 "total": template_store_status.get("templates_count", 0),
                 "by_type": {},
-                "by_language": template_store_status.get("templates_by_language", {})
+                "by_language": template_store_status.get("templates_by_language", {}),
+                "parse_cache": get_template_cache_stats()
             }
 
-            # Count templates by type
+            # Template counts by type are maintained incrementally by the store
             if _document_service.template_store:
-                type_counts = {}
-                for template in _document_service.template_store.templates.values():
-                    type_counts[template.type] = type_counts.get(template.type, 0) + 1
-                templates_info["by_type"] = type_counts
+                templates_info["by_type"] = _document_service.template_store.get_type_counts()
 
         else:
-            document_stats = ServiceStats(
+            document_stats = ServiceStats.model_construct(
                 status="unavailable",
                 ready=False,
                 details={}
@@ -407,12 +576,13 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
             templates_info = {
                 "total": 0,
                 "by_type": {},
-                "by_language": {}
+                "by_language": {},
+                "parse_cache": get_template_cache_stats()
             }
 
         logger.info("Admin stats retrieved")
 
-        return AdminStatsResponse(
+        stats = AdminStatsResponse.model_construct(
             tax_service=tax_stats,
             dispute_service=dispute_stats,
             document_service=document_stats,
@@ -420,16 +590,20 @@ async def get_admin_stats(_: bool = Depends(verify_admin_key)):
             disputes=disputes_info
         )
 
+        # Serialize with pydantic-core directly instead of FastAPI's
+        # validate-then-encode response path
+        return Response(content=stats.model_dump_json(), media_type="application/json")
+
     except Exception as e:
-        logger.error(f"Error getting admin stats: {e}", exc_info=True)
+        logger.exception("Error getting admin stats: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to get statistics: {str(e)}"
         )
 
 
-@router.get("/admin/health")
-async def admin_health_check(_: bool = Depends(verify_admin_key)):
+@router.get("/health")
+async def admin_health_check():
     """
     Simple health check for admin endpoints
 
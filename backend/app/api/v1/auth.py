@@ -1,14 +1,18 @@
 """
 Authentication API endpoints
 """
-from typing import Optional
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
 
 from fastapi import APIRouter, Depends, HTTPException, Header
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core import get_logger
-from app.db import get_async_session, User
+from app.db import database, get_async_session, User
 from app.services import (
     AuthService,
     TokenResponse,
@@ -17,6 +21,7 @@ from app.services import (
     UserResponse,
     UsageInfo,
     decode_access_token,
+    get_usage_limiter,
 )
 
 logger = get_logger(__name__)
@@ -25,6 +30,80 @@ router = APIRouter()
 # Security scheme for JWT
 security = HTTPBearer(auto_error=False)
 
+# Authenticated users by token digest, so repeat requests skip the user lookup
+_USER_CACHE_TTL_SECONDS = 60.0
+_USER_CACHE_MAX_SIZE = 10_000
+_user_cache: "OrderedDict[bytes, Tuple[float, User]]" = OrderedDict()
+
+
+# ============================================================================
+# User Cache
+# ============================================================================
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Digest a bearer token for use as a user cache key"""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+
+def _detached_copy(user: User) -> User:
+    """Copy a user's column values into a new detached instance"""
+    copy = User(**{
+        column.key: getattr(user, column.key) for column in User.__table__.columns
+    })
+    make_transient_to_detached(copy)
+    return copy
+
+
+def _get_cached_user(token: str) -> Optional[User]:
+    """
+    Get the cached user for a token
+
+    The user is a detached copy, so it never shadows fresh rows loaded
+    through the request's session (e.g. for usage counter updates).
+
+    Args:
+        token: Bearer token (already validated)
+
+    Returns:
+        User if cached and not expired, None otherwise
+    """
+    key = _token_cache_key(token)
+    entry = _user_cache.get(key)
+    if entry is None:
+        return None
+
+    expires_at, user = entry
+    if expires_at <= time.monotonic():
+        _user_cache.pop(key, None)
+        return None
+
+    _user_cache.move_to_end(key)
+    return _detached_copy(user)
+
+
+def _cache_user(token: str, user: User) -> None:
+    """Cache a snapshot of the user for a token"""
+    _user_cache[_token_cache_key(token)] = (
+        time.monotonic() + _USER_CACHE_TTL_SECONDS,
+        _detached_copy(user),
+    )
+    if len(_user_cache) > _USER_CACHE_MAX_SIZE:
+        _user_cache.popitem(last=False)
+
+
+def invalidate_user_cache(token: Optional[str] = None) -> None:
+    """
+    Drop cached users
+
+    Args:
+        token: Token whose entry to drop, or None to clear the whole cache
+    """
+    if token is None:
+        _user_cache.clear()
+    else:
+        _user_cache.pop(_token_cache_key(token), None)
+
 
 # ============================================================================
 # Dependencies
@@ -38,13 +117,15 @@ async def get_auth_service(
     return AuthService(session)
 
 
-async def get_current_user(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
-    session: AsyncSession = Depends(get_async_session),
-) -> User:
+def _authenticate_token(credentials: Optional[HTTPAuthorizationCredentials]) -> Tuple[str, str]:
     """
-    Dependency to get the current authenticated user from JWT token.
-    Raises 401 if not authenticated.
+    Validate bearer credentials
+
+    Returns:
+        Tuple of (token, user_id)
+
+    Raises:
+        HTTPException: 401 if missing, invalid or expired
     """
     if not credentials:
         raise HTTPException(
@@ -71,8 +152,14 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    return token, user_id
+
+
+async def _load_user(session: AsyncSession, token: str, user_id: str) -> User:
+    """Load a token's user from the database and cache it"""
+    # Detached like cached users, so callers see the same kind of object either way
     auth_service = AuthService(session)
-    user = await auth_service.get_user_by_id(user_id)
+    user = await auth_service.get_user_snapshot(user_id)
 
     if not user:
         raise HTTPException(
@@ -81,6 +168,13 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    _cache_user(token, user)
+    return user
+
+
+def _check_active(user: User) -> User:
+    """Reject disabled accounts"""
+    # Checked on cache hits too, so deactivation applies within the cache TTL
     if not user.is_active:
         raise HTTPException(
             status_code=401,
@@ -100,6 +194,45 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+    session: AsyncSession = Depends(get_async_session),
+) -> User:
+    """
+    Dependency to get the current authenticated user from JWT token.
+    Raises 401 if not authenticated.
+    """
+    token, user_id = _authenticate_token(credentials)
+
+    user = _get_cached_user(token)
+    if user is None:
+        user = await _load_user(session, token, user_id)
+
+    return _check_active(user)
+
+
+async def get_cached_current_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+) -> User:
+    """
+    Dependency like get_current_user that only opens a database session
+    when the token's user isn't cached.
+
+    For endpoints that don't otherwise use the database.
+    Raises 401 if not authenticated.
+    """
+    token, user_id = _authenticate_token(credentials)
+
+    user = _get_cached_user(token)
+    if user is None:
+        if not database.AsyncSessionLocal:
+            raise RuntimeError("Database not initialized. Call init_db() first.")
+        async with database.AsyncSessionLocal() as session:
+            user = await _load_user(session, token, user_id)
+
+    return _check_active(user)
+
+
 async def get_optional_current_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     session: AsyncSession = Depends(get_async_session),
@@ -210,9 +343,13 @@ async def get_current_user_info(
 
     Requires valid JWT token in Authorization header.
     """
+    # Write out this user's in-memory chat usage, then load the current
+    # counters (the user may come from the cache)
+    await get_usage_limiter().flush_user(current_user.id)
+    user = await auth_service.get_user_by_id(current_user.id) or current_user
     # Reset counters if needed
-    await auth_service.reset_usage_counters(current_user)
-    return auth_service.user_to_response(current_user)
+    await auth_service.reset_usage_counters(user)
+    return auth_service.user_to_response(user)
 
 
 @router.get("/auth/usage", response_model=UsageInfo)
@@ -225,9 +362,13 @@ async def get_usage_info(
 
     Returns daily and monthly request counts and limits.
     """
+    # Write out this user's in-memory chat usage, then load the current
+    # counters (the user may come from the cache)
+    await get_usage_limiter().flush_user(current_user.id)
+    user = await auth_service.get_user_by_id(current_user.id) or current_user
     # Reset counters if needed
-    await auth_service.reset_usage_counters(current_user)
-    return auth_service.get_usage_info(current_user)
+    await auth_service.reset_usage_counters(user)
+    return auth_service.get_usage_info(user)
 
 
 @router.post("/auth/refresh", response_model=TokenResponse)
@@ -256,11 +397,16 @@ async def refresh_token(
 
 
 @router.post("/auth/logout")
-async def logout():
+async def logout(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
+):
     """
     Logout endpoint (informational)
 
     JWT tokens are stateless, so logout is handled client-side by
-    removing the token. This endpoint exists for API completeness.
+    removing the token. This endpoint exists for API completeness and
+    drops the token's cached user.
     """
+    if credentials:
+        invalidate_user_cache(credentials.credentials)
     return {"message": "Successfully logged out. Please remove your token."}
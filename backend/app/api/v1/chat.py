@@ -1,20 +1,22 @@
 """
 Chat API endpoints for legal AI assistant
 """
-import time
 import uuid
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.auth import get_current_user
+from app.api.v1.responses import json_response
 from app.core import LLMError, get_logger
 from app.db import get_async_session, User
-from app.models import CitedArticle, QueryMode
-from app.services import AuthService, Orchestrator, TaxCodeService
-from app.storage import get_conversation_store
+from app.models import CitedArticle, QueryMode, UnifiedResponse
+from app.services import Orchestrator, TaxCodeService, get_usage_limiter
+from app.storage import ConversationStore, get_conversation_store
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -93,46 +95,92 @@ class ChatResponse(BaseModel):
 # ============================================================================
 
 
-@router.post("/chat", response_model=ChatResponse)
-async def chat(
-    request: ChatRequest,
-    current_user: User = Depends(get_current_user),
-    session: AsyncSession = Depends(get_async_session),
-):
+# Request mode string -> query mode
+_MODE_MAP = {mode.value: mode for mode in QueryMode}
+_VALID_MODES = list(_MODE_MAP)
+
+# Shared by every chat response built with model_construct (which doesn't
+# copy it), so it must never be mutated
+_NO_TEMPLATES: List[dict] = []
+
+
+def _sse_event(data: dict, event: Optional[str] = None) -> str:
+    """Format a Server-Sent Events message"""
+    payload = orjson.dumps(data).decode()
+    if event:
+        return f"event: {event}\ndata: {payload}\n\n"
+    return f"data: {payload}\n\n"
+
+
+def _to_chat_response(unified_response: UnifiedResponse, conversation_id: str) -> ChatResponse:
     """
-    Chat endpoint for legal AI assistant
+    Convert a unified orchestrator response to the chat response format
 
-    **Requires authentication** - Include JWT token in Authorization header.
+    The orchestrator output is already validated, so the models are built
+    with model_construct to skip a second validation pass.
+    """
+    tax_sources = [
+        ChatSource.model_construct(
+            article_number=article.article_number,
+            title=article.title,
+            snippet=article.snippet
+        )
+        for article in unified_response.sources.tax_articles
+    ]
+
+    case_sources = [
+        {
+            "doc_number": case.doc_number,
+            "date": case.date,
+            "category": case.category,
+            "decision_type": case.decision_type,
+            "snippet": case.snippet
+        }
+        for case in unified_response.sources.cases
+    ]
+
+    return ChatResponse.model_construct(
+        answer=unified_response.answer,
+        mode_used=unified_response.mode_used.value,
+        sources=ChatSources.model_construct(
+            tax_articles=tax_sources,
+            cases=case_sources,
+            templates=_NO_TEMPLATES  # Phase 3
+        ),
+        citations_verified=unified_response.citations_verified,
+        warnings=unified_response.warnings,
+        conversation_id=conversation_id,
+        processing_time_ms=unified_response.processing_time_ms
+    )
 
-    Supports multiple modes:
-    - Tax mode: Georgian Tax Code queries
-    - Dispute mode: Ministry of Finance dispute decisions
-    - Document mode: Document generation (Phase 3)
-    - Auto mode: Automatic mode detection based on query content
 
-    Args:
-        request: Chat request with message and options
+async def _prepare_chat(
+    request: ChatRequest,
+    current_user: User,
+    session: AsyncSession,
+) -> Tuple[Orchestrator, ConversationStore, str, QueryMode]:
+    """
+    Validate a chat request, count it against usage limits and resolve its conversation
 
     Returns:
-        Chat response with answer, sources, and metadata
+        Tuple of (orchestrator, conversation_store, conversation_id, mode)
 
     Raises:
-        HTTPException: If service not available, usage limit exceeded, or error occurs
+        HTTPException: If mode is invalid, usage limit exceeded, service
+            not available or conversation not found
     """
-    start_time = time.time()
-
     # Validate mode first (cheap check before usage increment)
-    valid_modes = ["tax", "dispute", "document", "auto"]
-    if request.mode not in valid_modes:
+    mode = _MODE_MAP.get(request.mode)
+    if mode is None:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid mode '{request.mode}'. Must be one of: {valid_modes}"
+            detail=f"Invalid mode '{request.mode}'. Must be one of: {_VALID_MODES}"
         )
 
-    # Atomically check and increment usage (prevents race conditions)
+    # Check and increment usage in memory (persisted by a background flush)
     # Increment happens BEFORE LLM call to prevent abuse via request flooding
-    auth_service = AuthService(session)
-    is_allowed, reason, updated_user = await auth_service.check_and_increment_usage(
+    is_allowed, reason, (daily_used, monthly_used) = await get_usage_limiter().check_and_increment(
+        session=session,
         user_id=str(current_user.id),
         endpoint="/v1/chat",
         request_type=request.mode,
@@ -144,8 +192,8 @@ async def chat(
                 "code": "USAGE_LIMIT_EXCEEDED",
                 "message": reason,
                 "usage": {
-                    "daily_used": updated_user.daily_requests_count if updated_user else 0,
-                    "monthly_used": updated_user.monthly_requests_count if updated_user else 0,
+                    "daily_used": daily_used,
+                    "monthly_used": monthly_used,
                 }
             }
         )
@@ -164,7 +212,7 @@ async def chat(
     conversation_id = request.conversation_id
     if conversation_id:
         # Verify conversation exists
-        if not conversation_store.get_conversation(conversation_id):
+        if not conversation_store.exists(conversation_id):
             raise HTTPException(
                 status_code=404,
                 detail=f"Conversation {conversation_id} not found"
@@ -173,19 +221,22 @@ async def chat(
         # Create new conversation
         conversation_id = conversation_store.create_conversation()
 
-    try:
-        # Route query through orchestrator
-        logger.info(f"Processing {request.mode} query for conversation {conversation_id}")
+    logger.info(f"Processing {request.mode} query for conversation {conversation_id}")
 
-        # Convert mode string to QueryMode enum
-        try:
-            mode = QueryMode(request.mode)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid mode: {request.mode}"
-            )
+    return orchestrator, conversation_store, conversation_id, mode
 
+
+async def _complete_chat(
+    request: ChatRequest,
+    current_user: User,
+    session: AsyncSession,
+) -> Response:
+    """Answer a chat request with a single buffered JSON response"""
+    orchestrator, conversation_store, conversation_id, mode = await _prepare_chat(
+        request, current_user, session
+    )
+
+    try:
         # Route query
         unified_response = await orchestrator.route_query(
             message=request.message,
@@ -194,53 +245,17 @@ async def chat(
             filters=None  # TODO: Add filters support
         )
 
-        # Save messages to conversation
-        conversation_store.add_message(
+        # Save the exchange to the conversation
+        conversation_store.add_messages(
             conversation_id=conversation_id,
-            role="user",
-            content=request.message
-        )
-        conversation_store.add_message(
-            conversation_id=conversation_id,
-            role="assistant",
-            content=unified_response.answer
+            messages=[
+                ("user", request.message),
+                ("assistant", unified_response.answer),
+            ]
         )
 
-        # Convert unified response to chat response format
-        tax_sources = [
-            ChatSource(
-                article_number=article.article_number,
-                title=article.title,
-                snippet=article.snippet
-            )
-            for article in unified_response.sources.tax_articles
-        ]
-
-        case_sources = [
-            {
-                "doc_number": case.doc_number,
-                "date": case.date,
-                "category": case.category,
-                "decision_type": case.decision_type,
-                "snippet": case.snippet
-            }
-            for case in unified_response.sources.cases
-        ]
-
-        # Usage was already incremented atomically at request start
-        return ChatResponse(
-            answer=unified_response.answer,
-            mode_used=unified_response.mode_used.value,
-            sources=ChatSources(
-                tax_articles=tax_sources,
-                cases=case_sources,
-                templates=[]  # Phase 3
-            ),
-            citations_verified=unified_response.citations_verified,
-            warnings=unified_response.warnings,
-            conversation_id=conversation_id,
-            processing_time_ms=unified_response.processing_time_ms
-        )
+        # Usage was already incremented at request start
+        return json_response(_to_chat_response(unified_response, conversation_id))
 
     except LLMError as e:
         logger.error(f"LLM error: {e}")
@@ -254,3 +269,113 @@ async def chat(
             status_code=500,
             detail=f"Internal server error: {str(e)}"
         )
+
+
+async def _stream_chat(
+    request: ChatRequest,
+    current_user: User,
+    session: AsyncSession,
+) -> StreamingResponse:
+    """Answer a chat request as a Server-Sent Events stream"""
+    # Validation errors are raised before the stream starts
+    orchestrator, conversation_store, conversation_id, mode = await _prepare_chat(
+        request, current_user, session
+    )
+
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            unified_response = None
+            async for item in orchestrator.route_query_stream(
+                message=request.message,
+                mode=mode,
+                conversation_id=conversation_id,
+                filters=None  # TODO: Add filters support
+            ):
+                if isinstance(item, str):
+                    yield _sse_event({"delta": item})
+                else:
+                    unified_response = item
+
+            # Save the exchange to the conversation
+            conversation_store.add_messages(
+                conversation_id=conversation_id,
+                messages=[
+                    ("user", request.message),
+                    ("assistant", unified_response.answer),
+                ]
+            )
+
+            yield _sse_event(
+                _to_chat_response(unified_response, conversation_id).model_dump(),
+                event="done"
+            )
+
+        except LLMError as e:
+            logger.error(f"LLM error: {e}")
+            yield _sse_event({"detail": f"LLM service error: {str(e)}"}, event="error")
+        except Exception as e:
+            logger.error(f"Unexpected error in chat stream: {e}")
+            yield _sse_event({"detail": f"Internal server error: {str(e)}"}, event="error")
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@router.post("/chat", response_model=ChatResponse)
+async def chat(
+    request: ChatRequest,
+    http_request: Request,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Chat endpoint for legal AI assistant
+
+    **Requires authentication** - Include JWT token in Authorization header.
+
+    Supports multiple modes:
+    - Tax mode: Georgian Tax Code queries
+    - Dispute mode: Ministry of Finance dispute decisions
+    - Document mode: Document generation (Phase 3)
+    - Auto mode: Automatic mode detection based on query content
+
+    Send `Accept: text/event-stream` to stream the answer as Server-Sent
+    Events: `data: {"delta": ...}` chunks, then an `event: done` message
+    carrying the full chat response (or `event: error`).
+
+    Args:
+        request: Chat request with message and options
+
+    Returns:
+        Chat response with answer, sources, and metadata
+
+    Raises:
+        HTTPException: If service not available, usage limit exceeded, or error occurs
+    """
+    if "text/event-stream" in http_request.headers.get("accept", ""):
+        return await _stream_chat(request, current_user, session)
+
+    return await _complete_chat(request, current_user, session)
+
+
+@router.post("/chat/complete", response_model=ChatResponse)
+async def chat_complete(
+    request: ChatRequest,
+    current_user: User = Depends(get_current_user),
+    session: AsyncSession = Depends(get_async_session),
+):
+    """
+    Non-streaming chat endpoint
+
+    Same as `/chat` but always returns a single JSON response.
+
+    Args:
+        request: Chat request with message and options
+
+    Returns:
+        Chat response with answer, sources, and metadata
+    """
+    return await _complete_chat(request, current_user, session)
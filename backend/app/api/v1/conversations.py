@@ -6,7 +6,8 @@ from typing import List, Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel, Field
 
-from app.api.v1.auth import get_current_user
+from app.api.v1.auth import get_cached_current_user
+from app.api.v1.responses import json_response
 from app.core import get_logger
 from app.db.models import User
 from app.storage import get_conversation_store
@@ -64,7 +65,7 @@ class ConversationListResponse(BaseModel):
 async def list_conversations(
     limit: int = 100,
     offset: int = 0,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_cached_current_user),
 ):
     """
     List all active conversations
@@ -82,18 +83,19 @@ async def list_conversations(
 
     summaries = conversation_store.list_conversations(limit=limit, offset=offset)
 
-    return ConversationListResponse(
+    # Summaries come straight from the store, skip re-validating them
+    return json_response(ConversationListResponse.model_construct(
         conversations=[
-            ConversationSummary(**summary) for summary in summaries
+            ConversationSummary.model_construct(**summary) for summary in summaries
         ],
-        total=len(summaries)
-    )
+        total=conversation_store.count_conversations()
+    ))
 
 
 @router.get("/conversations/{conversation_id}", response_model=ConversationDetail)
 async def get_conversation(
     conversation_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_cached_current_user),
 ):
     """
     Get a specific conversation with full message history
@@ -119,20 +121,20 @@ async def get_conversation(
             detail=f"Conversation {conversation_id} not found or expired"
         )
 
-    return ConversationDetail(
+    return json_response(ConversationDetail.model_construct(
         conversation_id=conversation["conversation_id"],
         created_at=conversation["created_at"].isoformat() + "Z",
         updated_at=conversation["updated_at"].isoformat() + "Z",
         expires_at=conversation["expires_at"].isoformat() + "Z",
         messages=[
-            ConversationMessage(**msg) for msg in conversation["messages"]
+            ConversationMessage.model_construct(**msg) for msg in conversation["messages"]
         ]
-    )
+    ))
 
 
 @router.post("/conversations", status_code=status.HTTP_201_CREATED)
 async def create_conversation(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_cached_current_user),
 ):
     """
     Create a new conversation
@@ -155,7 +157,7 @@ async def create_conversation(
 @router.delete("/conversations/{conversation_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_conversation(
     conversation_id: str,
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_cached_current_user),
 ):
     """
     Delete a conversation
@@ -184,7 +186,7 @@ async def delete_conversation(
 
 @router.get("/conversations/stats", response_model=dict)
 async def get_conversation_stats(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_cached_current_user),
 ):
     """
     Get conversation storage statistics
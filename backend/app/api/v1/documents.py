@@ -1,15 +1,21 @@
 """
 Document Generation API endpoints
 """
+import asyncio
+import hashlib
 import io
+import logging
+import os
+import re
 import time
 import uuid
 from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import StreamingResponse
+import anyio.to_thread
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, HTTPException, Query, status
+from fastapi.responses import Response
 from pydantic import BaseModel, Field
 
 from app.api.v1.auth import get_current_user
@@ -48,11 +54,27 @@ class StoredDocument:
         self.document_id = document_id
         self.expires_at = expires_at
         self.created_at = datetime.utcnow()
+        # DOCX conversion, started by the first download or after generation
+        self.docx_task: Optional["asyncio.Future[bytes]"] = None
+        # UTF-8 markdown, encoded by the first markdown download
+        self.markdown_bytes: Optional[bytes] = None
+
+
+# Document IDs generated per urandom read
+_ID_BATCH_SIZE = 64
 
 
 class DocumentStore:
     """
     In-memory document storage with TTL and size limits
+
+    Only touched from the event loop (DOCX conversion in the thread pool
+    works on the retrieved content, not the store), so it needs no lock.
+    Expired documents are popped from the front in insertion order, which
+    keeps cleanup proportional to the number of expired entries.
+
+    Documents live in this process, so a download has to reach the same
+    instance that generated it (see ConversationStore for the same limit).
     """
 
     def __init__(self, max_size: int = 100, ttl_seconds: int = 3600):
@@ -67,6 +89,28 @@ class DocumentStore:
         self.max_size = max_size
         self.ttl_seconds = ttl_seconds
 
+        # Random bytes for upcoming document IDs and the next unused offset
+        self._id_entropy = b""
+        self._id_offset = 0
+
+    def _new_document_id(self) -> str:
+        """
+        Generate a random (version 4) UUID string for a document
+
+        Reads entropy for a batch of IDs at a time instead of one urandom
+        call per document.
+
+        Returns:
+            New document ID
+        """
+        if self._id_offset >= len(self._id_entropy):
+            self._id_entropy = os.urandom(16 * _ID_BATCH_SIZE)
+            self._id_offset = 0
+
+        raw = self._id_entropy[self._id_offset:self._id_offset + 16]
+        self._id_offset += 16
+        return str(uuid.UUID(bytes=raw, version=4))
+
     def store(self, document: GeneratedDocument) -> str:
         """
         Store a document and return its ID
@@ -81,7 +125,7 @@ class DocumentStore:
         self._cleanup_expired()
 
         # Generate unique ID
-        document_id = str(uuid.uuid4())
+        document_id = self._new_document_id()
 
         # Calculate expiration
         expires_at = datetime.utcnow() + timedelta(seconds=self.ttl_seconds)
@@ -100,18 +144,18 @@ class DocumentStore:
             self.documents.popitem(last=False)
             logger.info("Removed oldest document due to size limit")
 
-        logger.info(f"Stored document: {document_id}, expires: {expires_at}")
+        logger.info("Stored document: %s, expires: %s", document_id, expires_at)
         return document_id
 
-    def retrieve(self, document_id: str) -> Optional[GeneratedDocument]:
+    def get(self, document_id: str) -> Optional[StoredDocument]:
         """
-        Retrieve a stored document
+        Get a stored document with its metadata
 
         Args:
             document_id: Document ID
 
         Returns:
-            GeneratedDocument or None if not found/expired
+            StoredDocument or None if not found/expired
         """
         stored_doc = self.documents.get(document_id)
 
@@ -121,25 +165,39 @@ class DocumentStore:
         # Check if expired
         if datetime.utcnow() > stored_doc.expires_at:
             del self.documents[document_id]
-            logger.info(f"Document expired: {document_id}")
+            logger.info("Document expired: %s", document_id)
             return None
 
-        return stored_doc.document
+        return stored_doc
+
+    def retrieve(self, document_id: str) -> Optional[GeneratedDocument]:
+        """
+        Retrieve a stored document
+
+        Args:
+            document_id: Document ID
+
+        Returns:
+            GeneratedDocument or None if not found/expired
+        """
+        stored_doc = self.get(document_id)
+        return stored_doc.document if stored_doc else None
 
     def _cleanup_expired(self):
         """Remove expired documents"""
+        # All documents share one TTL, so insertion order is expiry order
+        # and only the expired prefix needs to be visited
         now = datetime.utcnow()
-        expired_ids = [
-            doc_id
-            for doc_id, stored_doc in self.documents.items()
-            if now > stored_doc.expires_at
-        ]
-
-        for doc_id in expired_ids:
-            del self.documents[doc_id]
+        expired_count = 0
+        while self.documents:
+            oldest = next(iter(self.documents.values()))
+            if now <= oldest.expires_at:
+                break
+            self.documents.popitem(last=False)
+            expired_count += 1
 
-        if expired_ids:
-            logger.info(f"Cleaned up {len(expired_ids)} expired documents")
+        if expired_count:
+            logger.info("Cleaned up %d expired documents", expired_count)
 
     def get_stats(self) -> dict:
         """Get storage statistics"""
@@ -155,10 +213,84 @@ class DocumentStore:
 _document_store = DocumentStore(max_size=100, ttl_seconds=3600)
 
 
+# ============================================================================
+# Listing Response Cache
+# ============================================================================
+
+
+# Serialized type/template listings by request key, tagged with the template
+# store version they were built from and their ETag
+_RESPONSE_CACHE_MAX_SIZE = 256
+_response_cache: "OrderedDict[Tuple, Tuple[int, bytes, str]]" = OrderedDict()
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison)
+
+    Args:
+        if_none_match: Header value, '*' or a comma separated list of ETags
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's copy is current
+    """
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+    )
+
+
+async def _cached_json_response(
+    key: Tuple,
+    build: Callable[[], Awaitable[BaseModel]],
+    if_none_match: Optional[str] = None
+) -> Response:
+    """
+    Return a cached JSON listing, rebuilding it if the templates changed
+
+    The ETag is a hash of the body, so it stays valid across restarts and
+    only changes when the content does.
+
+    Args:
+        key: Cache key (endpoint name and parameters)
+        build: Builds the response model on a cache miss
+        if_none_match: Client's If-None-Match header, if any
+
+    Returns:
+        JSON response with the serialized model, or 304 if the client's
+        copy is current
+    """
+    # Taken before building so a change during the build invalidates the entry
+    version = get_document_service().template_store.version
+
+    entry = _response_cache.get(key)
+    if entry is not None and entry[0] == version:
+        _response_cache.move_to_end(key)
+        _, content, etag = entry
+    else:
+        model = await build()
+        # pydantic-core writes JSON bytes straight from the model, skipping the
+        # jsonable_encoder pass the app-wide ORJSONResponse would still need
+        content = model.__pydantic_serializer__.to_json(model)
+        etag = f'"{hashlib.blake2b(content, digest_size=16).hexdigest()}"'
+        _response_cache[key] = (version, content, etag)
+        _response_cache.move_to_end(key)
+        if len(_response_cache) > _RESPONSE_CACHE_MAX_SIZE:
+            _response_cache.popitem(last=False)
+
+    headers = {"ETag": etag}
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
+
+
 def set_document_service(service: DocumentService):
     """Set the document service instance"""
     global _document_service
     _document_service = service
+    _response_cache.clear()
 
 
 def get_document_service() -> DocumentService:
@@ -218,6 +350,81 @@ class DocumentGenerationResponse(BaseModel):
 # ============================================================================
 
 
+# Block-level markdown prefixes, one named group per line kind
+_DOCX_LINE_RE = re.compile(
+    r'(?P<heading>#{1,3} )'
+    r'|(?P<bold_line>(?=\*\*).*\*\*$)'
+    r'|(?P<rule>---)'
+    r'|(?P<bullet>- )'
+    r'|(?P<numbered>[0-9]\d*\. )'
+)
+_BOLD_RE = re.compile(r'\*\*(.*?)\*\*')
+
+
+def _docx_paragraph(doc, line: str) -> None:
+    """Add a regular paragraph, converting **bold** spans"""
+    p = doc.add_paragraph()
+    parts = _BOLD_RE.split(line)
+    for j, part in enumerate(parts):
+        run = p.add_run(part)
+        if j % 2:
+            run.bold = True
+
+
+def _docx_heading(doc, line: str) -> None:
+    """Add a '#', '##' or '###' heading"""
+    level = line.index(' ')
+    doc.add_heading(line[level + 1:], level=level)
+
+
+def _docx_bold_line(doc, line: str) -> None:
+    """Add a fully bold '**...**' line"""
+    doc.add_paragraph().add_run(line[2:-2]).bold = True
+
+
+def _docx_rule(doc, line: str) -> None:
+    """Add a '---' horizontal rule"""
+    doc.add_paragraph('_' * 50)
+
+
+def _docx_bullet(doc, line: str) -> None:
+    """Add a '- ' bullet item"""
+    doc.add_paragraph(line[2:], style='List Bullet')
+
+
+def _docx_numbered(doc, line: str) -> None:
+    """Add a '1. ' numbered list item"""
+    doc.add_paragraph(line.split('. ', 1)[1], style='List Number')
+
+
+# Handlers by _DOCX_LINE_RE group name (unmatched lines are paragraphs)
+_DOCX_LINE_HANDLERS = {
+    'heading': _docx_heading,
+    'bold_line': _docx_bold_line,
+    'rule': _docx_rule,
+    'bullet': _docx_bullet,
+    'numbered': _docx_numbered,
+}
+
+
+# Serialized blank document, so each conversion reopens it from memory
+# instead of loading python-docx's default template from disk
+_docx_template: Optional[bytes] = None
+
+
+def _new_docx_document():
+    """Create an empty python-docx Document from the cached blank template"""
+    global _docx_template
+    from docx import Document
+
+    if _docx_template is None:
+        template = io.BytesIO()
+        Document().save(template)
+        _docx_template = template.getvalue()
+
+    return Document(io.BytesIO(_docx_template))
+
+
 def markdown_to_docx(markdown_content: str) -> bytes:
     """
     Convert markdown to DOCX format
@@ -229,64 +436,20 @@ def markdown_to_docx(markdown_content: str) -> bytes:
         DOCX file bytes
     """
     try:
-        from docx import Document
-        from docx.shared import Pt, Inches
-        from docx.enum.text import WD_PARAGRAPH_ALIGNMENT
-        import re
-
-        doc = Document()
+        doc = _new_docx_document()
 
         # Process markdown line by line
-        lines = markdown_content.split('\n')
-        i = 0
-        while i < len(lines):
-            line = lines[i].strip()
-
+        for raw_line in markdown_content.split('\n'):
+            line = raw_line.strip()
             if not line:
-                i += 1
                 continue
-
-            # Headers
-            if line.startswith('# '):
-                heading = doc.add_heading(line[2:], level=1)
-            elif line.startswith('## '):
-                heading = doc.add_heading(line[3:], level=2)
-            elif line.startswith('### '):
-                heading = doc.add_heading(line[4:], level=3)
-            # Bold text
-            elif line.startswith('**') and line.endswith('**'):
-                p = doc.add_paragraph()
-                run = p.add_run(line[2:-2])
-                run.bold = True
-            # Horizontal rule
-            elif line.startswith('---'):
-                doc.add_paragraph('_' * 50)
-            # Lists
-            elif line.startswith('- '):
-                doc.add_paragraph(line[2:], style='List Bullet')
-            elif re.match(r'^\d+\. ', line):
-                doc.add_paragraph(line.split('. ', 1)[1], style='List Number')
-            # Regular paragraph
-            else:
-                # Handle inline formatting
-                p = doc.add_paragraph()
-                text = line
-
-                # Simple bold conversion
-                parts = re.split(r'\*\*(.*?)\*\*', text)
-                for j, part in enumerate(parts):
-                    if j % 2 == 0:
-                        p.add_run(part)
-                    else:
-                        run = p.add_run(part)
-                        run.bold = True
-
-            i += 1
+            match = _DOCX_LINE_RE.match(line)
+            handler = _DOCX_LINE_HANDLERS[match.lastgroup] if match else _docx_paragraph
+            handler(doc, line)
 
         # Save to bytes
         docx_bytes = io.BytesIO()
         doc.save(docx_bytes)
-        docx_bytes.seek(0)
 
         return docx_bytes.getvalue()
 
@@ -304,6 +467,91 @@ def markdown_to_docx(markdown_content: str) -> bytes:
         )
 
 
+# Conversions are CPU-bound and hold the GIL, so running more of them at once
+# than there are cores only slows the event loop; they also shouldn't be able
+# to take over the shared worker thread pool during a burst of downloads
+_docx_limiter: Optional[anyio.CapacityLimiter] = None
+
+
+def _get_docx_limiter() -> anyio.CapacityLimiter:
+    """Get the DOCX conversion limiter (created in the event loop on first use)"""
+    global _docx_limiter
+    if _docx_limiter is None:
+        _docx_limiter = anyio.CapacityLimiter(os.cpu_count() or 1)
+    return _docx_limiter
+
+
+# Recent DOCX conversions by markdown digest, shared across documents so
+# regenerating identical content doesn't convert it again
+_DOCX_CACHE_MAX_SIZE = 32
+_docx_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+
+
+async def _convert_docx(markdown_content: str) -> bytes:
+    """
+    Convert markdown to DOCX in a worker thread, reusing recent conversions
+
+    Args:
+        markdown_content: Markdown formatted text
+
+    Returns:
+        DOCX file bytes
+    """
+    key = hashlib.blake2b(markdown_content.encode("utf-8"), digest_size=16).digest()
+
+    docx = _docx_cache.get(key)
+    if docx is not None:
+        _docx_cache.move_to_end(key)
+        return docx
+
+    # python-docx is blocking, keep it off the event loop
+    docx = await anyio.to_thread.run_sync(
+        markdown_to_docx, markdown_content, limiter=_get_docx_limiter()
+    )
+
+    _docx_cache[key] = docx
+    if len(_docx_cache) > _DOCX_CACHE_MAX_SIZE:
+        _docx_cache.popitem(last=False)
+    return docx
+
+
+async def _get_docx(stored: StoredDocument) -> bytes:
+    """
+    Get a stored document as DOCX, converting it at most once
+
+    Concurrent callers share one conversion; a failed conversion is
+    dropped so the next download retries it.
+
+    Args:
+        stored: Stored document
+
+    Returns:
+        DOCX file bytes
+    """
+    task = stored.docx_task
+    if task is None:
+        task = stored.docx_task = asyncio.ensure_future(
+            _convert_docx(stored.document.content)
+        )
+
+    try:
+        # Shielded so a client disconnecting doesn't cancel the shared conversion
+        return await asyncio.shield(task)
+    except Exception:
+        if stored.docx_task is task:
+            stored.docx_task = None
+        raise
+
+
+async def _prepare_docx(stored: StoredDocument) -> None:
+    """Convert a newly generated document ahead of its download"""
+    try:
+        await _get_docx(stored)
+    except Exception:
+        # Already logged by markdown_to_docx; the download retries it
+        pass
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -313,6 +561,7 @@ def markdown_to_docx(markdown_content: str) -> bytes:
 async def list_document_types(
     language: str = "ka",
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     List all available document types
@@ -325,13 +574,14 @@ async def list_document_types(
     Returns:
         List of document types with descriptions
     """
-    try:
-        service = get_document_service()
-        types = await service.list_document_types(language=language)
+    async def build() -> DocumentTypesResponse:
+        types = await get_document_service().list_document_types()
+        logger.info("Listed %d document types", len(types), extra={"language": language})
+        return DocumentTypesResponse.model_construct(types=types, total=len(types))
 
-        logger.info(f"Listed {len(types)} document types", extra={"language": language})
-
-        return DocumentTypesResponse(types=types, total=len(types))
+    try:
+        # Types carry names in both languages, so the listing is the same for each
+        return await _cached_json_response(("types",), build, if_none_match)
 
     except Exception as e:
         logger.error(f"Error listing document types: {str(e)}", exc_info=True)
@@ -345,6 +595,7 @@ async def list_document_types(
 async def get_document_type(
     type_id: str,
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get a specific document type by ID
@@ -357,9 +608,8 @@ async def get_document_type(
     Returns:
         Document type with full field definitions
     """
-    try:
-        service = get_document_service()
-        template_store = service.template_store
+    async def build() -> DocumentType:
+        template_store = get_document_service().template_store
 
         doc_type = template_store.get_document_type(type_id)
 
@@ -369,9 +619,12 @@ async def get_document_type(
                 detail=f"Document type not found: {type_id}"
             )
 
-        logger.info(f"Retrieved document type: {type_id}")
+        logger.info("Retrieved document type: %s", type_id)
         return doc_type
 
+    try:
+        return await _cached_json_response(("type", type_id), build, if_none_match)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -389,6 +642,7 @@ async def search_templates(
     language: str = "ka",
     limit: int = 10,
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Search for document templates
@@ -404,32 +658,33 @@ async def search_templates(
     Returns:
         List of matching templates
     """
-    try:
+    async def build() -> TemplateSearchResponse:
         service = get_document_service()
 
         if query:
             templates = await service.search_templates(
                 query=query, document_type=document_type, language=language
             )
+            templates = templates[:limit]
         else:
-            # If no query, get all templates of the specified type
-            templates = await service.search_templates(
-                query="", language=language
+            # If no query, list templates of the type (or of every type) directly
+            templates = await service.list_templates_by_type(
+                document_type=document_type or None, language=language, limit=limit
             )
 
-            # Filter by document type if specified
-            if document_type:
-                templates = [t for t in templates if t.type == document_type]
-
-        # Apply limit
-        templates = templates[:limit]
-
         logger.info(
-            f"Found {len(templates)} templates",
+            "Found %d templates", len(templates),
             extra={"query": query, "document_type": document_type, "language": language}
         )
 
-        return TemplateSearchResponse(templates=templates, total=len(templates))
+        # The templates are already validated models; only serialization is left,
+        # done in one pass by pydantic-core in _cached_json_response
+        return TemplateSearchResponse.model_construct(templates=templates, total=len(templates))
+
+    try:
+        return await _cached_json_response(
+            ("templates", query, document_type, language, limit), build, if_none_match
+        )
 
     except Exception as e:
         logger.error(f"Error searching templates: {str(e)}", exc_info=True)
@@ -443,6 +698,7 @@ async def search_templates(
 async def get_template(
     template_id: str,
     current_user: User = Depends(get_current_user),
+    if_none_match: Optional[str] = Header(None),
 ):
     """
     Get a specific template by ID
@@ -455,9 +711,8 @@ async def get_template(
     Returns:
         Template details including variables and content
     """
-    try:
-        service = get_document_service()
-        template_store = service.template_store
+    async def build() -> DocumentTemplate:
+        template_store = get_document_service().template_store
 
         if not template_store or template_id not in template_store.templates:
             raise HTTPException(
@@ -466,9 +721,12 @@ async def get_template(
             )
 
         template = template_store.templates[template_id]
-        logger.info(f"Retrieved template: {template_id}")
+        logger.info("Retrieved template: %s", template_id)
         return template
 
+    try:
+        return await _cached_json_response(("template", template_id), build, if_none_match)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -482,6 +740,7 @@ async def get_template(
 @router.post("/documents/generate", response_model=DocumentGenerationResponse)
 async def generate_document(
     request: DocumentGenerationRequest,
+    background_tasks: BackgroundTasks,
     current_user: User = Depends(get_current_user),
 ):
     """
@@ -495,19 +754,21 @@ async def generate_document(
     Returns:
         Generated document with content, metadata, and download links
     """
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
         service = get_document_service()
 
-        logger.info(
-            f"Generating document from template: {request.template_id}",
-            extra={
-                "template_id": request.template_id,
-                "document_type": request.document_type,
-                "format": request.format
-            }
-        )
+        # Skip building the log context when INFO is filtered out
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Generating document from template: %s", request.template_id,
+                extra={
+                    "template_id": request.template_id,
+                    "document_type": request.document_type,
+                    "format": request.format
+                }
+            )
 
         # Generate document
         document = await service.generate_document(request)
@@ -515,6 +776,9 @@ async def generate_document(
         # Store document for downloads
         document_id = _document_store.store(document)
 
+        # Have the DOCX ready by the time it's downloaded, after responding
+        background_tasks.add_task(_prepare_docx, _document_store.get(document_id))
+
         # Create download links
         base_url = "/v1/documents/download"
         download_links = DownloadLinks(
@@ -523,18 +787,19 @@ async def generate_document(
             pdf=None  # PDF not implemented in MVP
         )
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
-
-        logger.info(
-            f"Document generated successfully: {document_id}",
-            extra={
-                "document_id": document_id,
-                "template_id": request.template_id,
-                "format": document.format,
-                "processing_time_ms": processing_time_ms,
-                "warnings": len(document.warnings)
-            }
-        )
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Document generated successfully: %s", document_id,
+                extra={
+                    "document_id": document_id,
+                    "template_id": request.template_id,
+                    "format": document.format,
+                    "processing_time_ms": processing_time_ms,
+                    "warnings": len(document.warnings)
+                }
+            )
 
         return DocumentGenerationResponse(
             content=document.content,
@@ -579,30 +844,38 @@ async def download_document(
         format: Output format (md, docx, pdf)
 
     Returns:
-        File download stream
+        File download response
     """
     try:
         # Retrieve document from storage
-        document = _document_store.retrieve(document_id)
+        stored = _document_store.get(document_id)
 
-        if not document:
+        if not stored:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Document not found or expired"
             )
 
-        # Determine filename
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        base_filename = f"{document.document_type}_{timestamp}"
+        document = stored.document
+
+        # Determine filename (YYYYMMDD_HHMMSS, formatted without strftime)
+        now = datetime.utcnow()
+        base_filename = (
+            f"{document.document_type}_"
+            f"{now.year:04d}{now.month:02d}{now.day:02d}_"
+            f"{now.hour:02d}{now.minute:02d}{now.second:02d}"
+        )
 
         # Convert and return based on format
         if format == "md" or format == "markdown":
-            content = document.content.encode('utf-8')
+            if stored.markdown_bytes is None:
+                stored.markdown_bytes = document.content.encode('utf-8')
+            content = stored.markdown_bytes
             media_type = "text/markdown"
             filename = f"{base_filename}.md"
 
         elif format == "docx":
-            content = markdown_to_docx(document.content)
+            content = await _get_docx(stored)
             media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
             filename = f"{base_filename}.docx"
 
@@ -619,13 +892,16 @@ async def download_document(
                 detail=f"Unsupported format: {format}. Use 'md' or 'docx'"
             )
 
-        logger.info(
-            f"Downloaded document: {document_id}",
-            extra={"format": format, "filename": filename}
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Downloaded document: %s", document_id,
+                extra={"format": format, "filename": filename}
+            )
 
-        return StreamingResponse(
-            io.BytesIO(content),
+        # The file is already in memory; a plain Response sends it in one piece
+        # with a Content-Length, where streaming a BytesIO went line by line
+        return Response(
+            content=content,
             media_type=media_type,
             headers={"Content-Disposition": f'attachment; filename="{filename}"'}
         )
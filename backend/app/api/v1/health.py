@@ -4,7 +4,7 @@ Health check and status endpoints
 from datetime import datetime
 from typing import Dict
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from app.core import get_logger
 from app.services import TaxCodeService
@@ -15,6 +15,9 @@ router = APIRouter()
 # Global service instances (will be initialized in main.py)
 _tax_service: TaxCodeService = None
 
+# Set once background service initialization has finished
+_services_ready = False
+
 
 def set_tax_service(service: TaxCodeService):
     """Set the tax service instance"""
@@ -27,6 +30,12 @@ def get_tax_service() -> TaxCodeService:
     return _tax_service
 
 
+def set_services_ready(ready: bool = True):
+    """Mark background service initialization as finished"""
+    global _services_ready
+    _services_ready = ready
+
+
 @router.get("/health")
 async def health_check():
     """
@@ -41,6 +50,32 @@ async def health_check():
     }
 
 
+@router.get("/ready")
+async def readiness_check():
+    """
+    Readiness check endpoint
+
+    Unlike /health, fails until background service initialization has
+    finished, so traffic can be held back from a cold instance.
+
+    Returns:
+        Readiness status
+
+    Raises:
+        HTTPException: 503 while services are still initializing
+    """
+    if not _services_ready:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Services initializing"
+        )
+
+    return {
+        "status": "ready",
+        "timestamp": datetime.utcnow().isoformat() + "Z"
+    }
+
+
 @router.get("/status")
 async def service_status():
     """
@@ -0,0 +1,24 @@
+"""
+Shared response helpers for API v1 routes
+"""
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+
+def json_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with its compiled pydantic serializer
+
+    Returning a Response skips FastAPI's response_model pass, which would
+    validate the model again before encoding it.
+
+    Args:
+        model: Response model instance
+
+    Returns:
+        JSON response with the serialized model
+    """
+    return Response(
+        content=model.__pydantic_serializer__.to_json(model),
+        media_type="application/json"
+    )
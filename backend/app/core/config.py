@@ -43,6 +43,14 @@ class Settings(BaseSettings):
     )
 
     # Rate Limiting
+    rate_limit_enabled: bool = Field(
+        False,
+        description=(
+            "Enforce per-client-IP rate limiting; behind a proxy, uvicorn must be "
+            "allowed to trust X-Forwarded-For (--forwarded-allow-ips) so clients "
+            "don't share the proxy's IP"
+        )
+    )
     rate_limit_requests: int = Field(
         60,
         description="Maximum number of requests allowed per window"
@@ -58,6 +66,18 @@ class Settings(BaseSettings):
 
     # Database
     database_url: Optional[str] = Field(None, description="Database connection URL")
+    db_pool_size: int = Field(
+        20,
+        description="Persistent connections kept per process (not used for SQLite)"
+    )
+    db_max_overflow: int = Field(
+        10,
+        description="Extra connections opened under load beyond db_pool_size"
+    )
+    db_pool_recycle_seconds: int = Field(
+        1800,
+        description="Seconds after which pooled connections are replaced"
+    )
 
     # JWT Authentication
     jwt_secret_key: str = Field(
@@ -79,6 +99,14 @@ class Settings(BaseSettings):
         1000,
         description="Maximum chat requests per user per month"
     )
+    usage_flush_interval_seconds: float = Field(
+        5.0,
+        description="Seconds between writes of in-memory usage counters to the database"
+    )
+    usage_flush_max_pending: int = Field(
+        100,
+        description="Pending usage records that trigger an early counter flush"
+    )
 
     # Vector Database (optional for future use)
     vector_db_type: Optional[str] = Field(None, description="Vector database type (pinecone/weaviate/chroma)")
@@ -161,7 +189,12 @@ class Settings(BaseSettings):
         return v
 
     def get_cors_origins_list(self) -> list[str]:
-        """Parse CORS origins from comma-separated string"""
+        """
+        Parse CORS origins from comma-separated string
+
+        Only called when the CORS middleware is added at startup; the middleware
+        keeps the list, so preflights never parse the setting again.
+        """
         return [origin.strip() for origin in self.cors_origins.split(",") if origin.strip()]
 
     def is_development(self) -> bool:
@@ -1,10 +1,15 @@
 """
 Custom exceptions and exception handlers for the application
 """
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 from fastapi import Request, status
-from fastapi.responses import JSONResponse
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+
+from app.core.logging import get_logger, request_id_var, set_request_id
+
+logger = get_logger(__name__)
 
 
 # ============================================================================
@@ -13,16 +18,32 @@ from fastapi.responses import JSONResponse
 
 
 class LegalAIException(Exception):
-    """Base exception for all Legal AI exceptions"""
+    """
+    Base exception for all Legal AI exceptions
+
+    Subclasses set default_message and default_status_code instead of
+    overriding __init__.
+    """
+
+    default_message: ClassVar[str] = "Internal server error"
+    default_status_code: ClassVar[int] = status.HTTP_500_INTERNAL_SERVER_ERROR
 
     def __init__(
         self,
-        message: str,
-        status_code: int = status.HTTP_500_INTERNAL_SERVER_ERROR,
+        message: Optional[str] = None,
+        status_code: Optional[int] = None,
         details: Optional[dict[str, Any]] = None
     ):
-        self.message = message
-        self.status_code = status_code
+        """
+        Initialize exception
+
+        Args:
+            message: Error message (defaults to the class's default_message)
+            status_code: HTTP status code (defaults to the class's default_status_code)
+            details: Additional error details
+        """
+        self.message = message if message is not None else self.default_message
+        self.status_code = status_code if status_code is not None else self.default_status_code
         self.details = details or {}
         super().__init__(self.message)
 
@@ -30,151 +51,71 @@ class LegalAIException(Exception):
 class TaxCodeNotFoundError(LegalAIException):
     """Raised when tax code document or section is not found"""
 
-    def __init__(
-        self,
-        message: str = "Tax code document not found",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_404_NOT_FOUND,
-            details=details
-        )
+    default_message = "Tax code document not found"
+    default_status_code = status.HTTP_404_NOT_FOUND
 
 
 class LLMError(LegalAIException):
     """Raised when LLM service encounters an error"""
 
-    def __init__(
-        self,
-        message: str = "LLM service error",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            details=details
-        )
+    default_message = "LLM service error"
+    default_status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
 
 class RateLimitError(LegalAIException):
     """Raised when rate limit is exceeded"""
 
-    def __init__(
-        self,
-        message: str = "Rate limit exceeded",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            details=details
-        )
+    default_message = "Rate limit exceeded"
+    default_status_code = status.HTTP_429_TOO_MANY_REQUESTS
 
 
 class ValidationError(LegalAIException):
     """Raised when validation fails"""
 
-    def __init__(
-        self,
-        message: str = "Validation error",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            details=details
-        )
+    default_message = "Validation error"
+    default_status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
 class ConfigurationError(LegalAIException):
     """Raised when configuration is invalid or missing"""
 
-    def __init__(
-        self,
-        message: str = "Configuration error",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            details=details
-        )
+    default_message = "Configuration error"
+    default_status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
 class VectorDBError(LegalAIException):
     """Raised when vector database encounters an error"""
 
-    def __init__(
-        self,
-        message: str = "Vector database error",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            details=details
-        )
+    default_message = "Vector database error"
+    default_status_code = status.HTTP_503_SERVICE_UNAVAILABLE
 
 
 class CitationExtractionError(LegalAIException):
     """Raised when citation extraction fails"""
 
-    def __init__(
-        self,
-        message: str = "Citation extraction error",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            details=details
-        )
+    default_message = "Citation extraction error"
+    default_status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
 
 
 class ConversationNotFoundError(LegalAIException):
     """Raised when conversation is not found"""
 
-    def __init__(
-        self,
-        message: str = "Conversation not found",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_404_NOT_FOUND,
-            details=details
-        )
+    default_message = "Conversation not found"
+    default_status_code = status.HTTP_404_NOT_FOUND
 
 
 class AuthenticationError(LegalAIException):
     """Raised when authentication fails"""
 
-    def __init__(
-        self,
-        message: str = "Authentication failed",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            details=details
-        )
+    default_message = "Authentication failed"
+    default_status_code = status.HTTP_401_UNAUTHORIZED
 
 
 class AuthorizationError(LegalAIException):
     """Raised when authorization fails"""
 
-    def __init__(
-        self,
-        message: str = "Not authorized",
-        details: Optional[dict[str, Any]] = None
-    ):
-        super().__init__(
-            message=message,
-            status_code=status.HTTP_403_FORBIDDEN,
-            details=details
-        )
+    default_message = "Not authorized"
+    default_status_code = status.HTTP_403_FORBIDDEN
 
 
 # ============================================================================
@@ -185,7 +126,7 @@ class AuthorizationError(LegalAIException):
 async def legal_ai_exception_handler(
     request: Request,
     exc: LegalAIException
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle all Legal AI custom exceptions
 
@@ -196,14 +137,14 @@ async def legal_ai_exception_handler(
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {
                 "type": type(exc).__name__,
                 "message": exc.message,
                 "details": exc.details,
-                "path": str(request.url.path),
+                "path": request.scope["path"],
             }
         }
     )
@@ -212,7 +153,7 @@ async def legal_ai_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle all unhandled exceptions
 
@@ -223,7 +164,20 @@ async def general_exception_handler(
     Returns:
         JSON response with error details
     """
-    return JSONResponse(
+    # Runs in ServerErrorMiddleware, after RequestIDMiddleware has reset the
+    # context var, so take the ID from the request state
+    request_id = getattr(request.state, "request_id", None)
+
+    token = set_request_id(request_id)
+    try:
+        logger.error(
+            f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
+            exc_info=True
+        )
+    finally:
+        request_id_var.reset(token)
+
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": {
@@ -233,8 +187,9 @@ async def general_exception_handler(
                     "exception_type": type(exc).__name__,
                     "exception_message": str(exc),
                 },
-                "path": str(request.url.path),
-            }
+                "path": request.scope["path"],
+            },
+            "request_id": request_id,
         }
     )
 
@@ -242,7 +197,7 @@ async def general_exception_handler(
 async def validation_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Handle Pydantic validation exceptions
 
@@ -254,7 +209,7 @@ async def validation_exception_handler(
         JSON response with validation error details
     """
     # This will be called for RequestValidationError from FastAPI
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": {
@@ -263,7 +218,7 @@ async def validation_exception_handler(
                 "details": {
                     "errors": str(exc),
                 },
-                "path": str(request.url.path),
+                "path": request.scope["path"],
             }
         }
     )
@@ -281,8 +236,6 @@ def register_exception_handlers(app) -> None:
     Args:
         app: FastAPI application instance
     """
-    from fastapi.exceptions import RequestValidationError
-
     # Register custom exception handlers
     app.add_exception_handler(LegalAIException, legal_ai_exception_handler)
     app.add_exception_handler(Exception, general_exception_handler)
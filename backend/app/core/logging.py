@@ -4,18 +4,49 @@ Logging configuration and utilities with structured logging support
 import json
 import logging
 import sys
-from contextvars import ContextVar
-from datetime import datetime
+import time
+import traceback
+from contextvars import ContextVar, Token
+from inspect import istraceback
 from typing import Any, Optional
 
+import orjson
 from pythonjsonlogger import jsonlogger
 
 # Context variable for request ID tracking
 request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
+# orjson options for log records: UTC datetimes end in "Z", and non-string
+# keys in extra fields are allowed as with the stdlib encoder
+_ORJSON_LOG_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+
+# Level names accepted by log_with_extra -> logging levels
+_LEVELS = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values orjson doesn't support natively, like python-json-logger does"""
+    if istraceback(obj):
+        return "".join(traceback.format_tb(obj)).strip()
+    return str(obj)
+
 
 class JSONFormatter(jsonlogger.JsonFormatter):
-    """Custom JSON formatter with additional fields"""
+    """Custom JSON formatter with additional fields, encoded with orjson"""
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+
+        # Last formatted UTC second; handlers format under their lock, so no race
+        self._timestamp_second = -1
+        self._timestamp_prefix = ""
 
     def add_fields(
         self,
@@ -26,8 +57,16 @@ class JSONFormatter(jsonlogger.JsonFormatter):
         """Add custom fields to log record"""
         super().add_fields(log_record, record, message_dict)
 
-        # Add timestamp
-        log_record["timestamp"] = datetime.utcnow().isoformat() + "Z"
+        # Add timestamp (ISO 8601 UTC), reusing the prefix for records within
+        # the same second; microseconds are truncated like record.msecs
+        created = record.created
+        second = int(created)
+        if second != self._timestamp_second:
+            self._timestamp_prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._timestamp_second = second
+        log_record["timestamp"] = (
+            f"{self._timestamp_prefix}.{int((created - second) * 1_000_000):06d}Z"
+        )
 
         # Add log level
         log_record["level"] = record.levelname
@@ -49,6 +88,12 @@ class JSONFormatter(jsonlogger.JsonFormatter):
         if hasattr(record, "extra_fields"):
             log_record.update(record.extra_fields)
 
+    def jsonify_log_record(self, log_record: dict[str, Any]) -> str:
+        """Encode the log record with orjson instead of the stdlib encoder"""
+        return orjson.dumps(
+            log_record, default=_json_default, option=_ORJSON_LOG_OPTIONS
+        ).decode()
+
 
 class PrettyFormatter(logging.Formatter):
     """Pretty formatter for development with colors"""
@@ -63,18 +108,43 @@ class PrettyFormatter(logging.Formatter):
         "RESET": "\033[0m",      # Reset
     }
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+
+        # Colored, padded level names, built once
+        self._colored_levels = {
+            name: f"{color}{name:8}{self.COLORS['RESET']}"
+            for name, color in self.COLORS.items()
+        }
+
+        # Last formatted second; handlers format under their lock, so no race
+        self._timestamp_second = -1
+        self._timestamp = ""
+
+        # Last request ID and its tag, reused for consecutive records of a request
+        self._request_id: Optional[str] = None
+        self._request_id_str = "[--------]"
+
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
         # Add color to level name
-        level_color = self.COLORS.get(record.levelname, self.COLORS["RESET"])
-        colored_level = f"{level_color}{record.levelname:8}{self.COLORS['RESET']}"
+        colored_level = self._colored_levels.get(record.levelname)
+        if colored_level is None:
+            colored_level = f"{self.COLORS['RESET']}{record.levelname:8}{self.COLORS['RESET']}"
 
-        # Format timestamp
-        timestamp = datetime.fromtimestamp(record.created).strftime("%Y-%m-%d %H:%M:%S")
+        # Format timestamp, reusing it for records within the same second
+        second = int(record.created)
+        if second != self._timestamp_second:
+            self._timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second))
+            self._timestamp_second = second
+        timestamp = self._timestamp
 
         # Get request ID if available
         request_id = request_id_var.get()
-        request_id_str = f"[{request_id[:8]}]" if request_id else "[--------]"
+        if request_id != self._request_id:
+            self._request_id = request_id
+            self._request_id_str = f"[{request_id[:8]}]" if request_id else "[--------]"
+        request_id_str = self._request_id_str
 
         # Build message
         message = record.getMessage()
@@ -141,6 +211,9 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance
 
+    Plain stdlib loggers, cached by the logging module and configured once by
+    setup_logging; modules call this once at import time.
+
     Args:
         name: Logger name (typically __name__)
 
@@ -150,14 +223,17 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
-def set_request_id(request_id: str) -> None:
+def set_request_id(request_id: str) -> Token:
     """
     Set request ID for current context
 
     Args:
         request_id: Request ID to set
+
+    Returns:
+        Token that restores the previous value via request_id_var.reset()
     """
-    request_id_var.set(request_id)
+    return request_id_var.set(request_id)
 
 
 def get_request_id() -> Optional[str]:
@@ -174,6 +250,7 @@ def log_with_extra(
     logger: logging.Logger,
     level: str,
     message: str,
+    stacklevel: int = 2,
     **extra_fields: Any
 ) -> None:
     """
@@ -183,20 +260,15 @@ def log_with_extra(
         logger: Logger instance
         level: Log level (debug, info, warning, error, critical)
         message: Log message
+        stacklevel: Frame the record is attributed to; 2 is our caller,
+            wrappers in this module pass 3 for theirs
         **extra_fields: Additional fields to include in log
     """
-    log_method = getattr(logger, level.lower())
-    record = logger.makeRecord(
-        logger.name,
-        getattr(logging, level.upper()),
-        "(unknown file)",
-        0,
-        message,
-        (),
-        None
-    )
-    record.extra_fields = extra_fields
-    logger.handle(record)
+    level_no = _LEVELS[level]
+    if not logger.isEnabledFor(level_no):
+        return
+
+    logger.log(level_no, message, extra={"extra_fields": extra_fields}, stacklevel=stacklevel)
 
 
 # Example usage functions
@@ -217,10 +289,15 @@ def log_api_request(
         status_code: Response status code
         duration_ms: Request duration in milliseconds
     """
+    # Skip building the message and fields when INFO is muted
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     log_with_extra(
         logger,
         "info",
         f"{method} {path} - {status_code}",
+        stacklevel=3,
         method=method,
         path=path,
         status_code=status_code,
@@ -247,10 +324,14 @@ def log_llm_request(
         completion_tokens: Number of completion tokens
         duration_ms: Request duration in milliseconds
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     log_with_extra(
         logger,
         "info",
         f"LLM request to {provider} ({model})",
+        stacklevel=3,
         provider=provider,
         model=model,
         prompt_tokens=prompt_tokens,
@@ -284,5 +365,6 @@ def log_error(
         logger,
         "error",
         f"Error occurred: {error}",
+        stacklevel=3,
         **extra_fields
     )
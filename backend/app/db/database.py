@@ -39,10 +39,24 @@ async def init_db() -> None:
     logger.info(f"Connecting to database...")
 
     # Create async engine
+    if "sqlite" in database_url:
+        engine_options = {"poolclass": NullPool}
+    else:
+        # Keep enough warm connections for request concurrency, so bursts don't
+        # pay connection setup; recycle before server-side idle timeouts
+        engine_options = {
+            "pool_size": settings.db_pool_size,
+            "max_overflow": settings.db_max_overflow,
+            "pool_recycle": settings.db_pool_recycle_seconds,
+        }
+        if "asyncpg" in database_url:
+            # Queries are short lookups; JIT compilation only adds latency
+            engine_options["connect_args"] = {"server_settings": {"jit": "off"}}
+
     _engine = create_async_engine(
         database_url,
         echo=settings.is_development(),
-        poolclass=NullPool if "sqlite" in database_url else None,
+        **engine_options,
     )
 
     # Create session factory
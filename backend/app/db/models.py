@@ -1,6 +1,8 @@
 """
 SQLAlchemy database models for user management and usage tracking
 """
+import os
+import time
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
@@ -9,15 +11,33 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     func,
+    text,
 )
 from sqlalchemy import String
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
+def _time_ordered_uuid() -> str:
+    """
+    Generate a UUIDv7-style ID: 48-bit millisecond timestamp, then random bits
+
+    The text form sorts by creation time, so new rows append to the end of
+    the primary key index instead of landing on random pages.
+
+    Returns:
+        UUID string in the usual 36-character form
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
     pass
@@ -117,17 +137,22 @@ class UsageRecord(Base):
     """Usage record for tracking individual API requests"""
 
     __tablename__ = "usage_records"
+    __table_args__ = (
+        # Serves "latest records for a user" without a sort; also covers
+        # lookups on user_id alone, so that column has no index of its own
+        Index("ix_usage_records_user_created", "user_id", text("created_at DESC")),
+    )
 
+    # Time-ordered since records are inserted continuously and never looked up by ID
     id: Mapped[str] = mapped_column(
         String(36),
         primary_key=True,
-        default=lambda: str(uuid.uuid4()),
+        default=_time_ordered_uuid,
     )
     user_id: Mapped[str] = mapped_column(
         String(36),
         ForeignKey("users.id", ondelete="CASCADE"),
         nullable=False,
-        index=True,
     )
     endpoint: Mapped[str] = mapped_column(
         String(255),
@@ -1,15 +1,22 @@
 """
 FastAPI application entry point for Legal AI system
 """
+import asyncio
+import math
 import time
+import uuid
+from collections import OrderedDict
 from contextlib import asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.api.v1 import admin, auth, chat, conversations, documents, health
 from app.core import (
@@ -19,7 +26,15 @@ from app.core import (
     set_request_id,
     setup_logging,
 )
-from app.services import DisputeService, DocumentService, Orchestrator, TaxCodeService
+from app.core.logging import request_id_var
+from app.db import close_db, init_db
+from app.services import (
+    DisputeService,
+    DocumentService,
+    Orchestrator,
+    TaxCodeService,
+    get_usage_limiter,
+)
 
 # Initialize logger
 logger = get_logger(__name__)
@@ -46,38 +61,27 @@ async def initialize_services_background():
     """
     global tax_service, dispute_service, document_service, orchestrator
 
-    # Initialize tax service
     tax_service = TaxCodeService()
-
-    try:
-        logger.info("Initializing Tax Code Service...")
-        await tax_service.initialize()
-        logger.info("Tax Code Service initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize Tax Code Service: {e}")
-        logger.warning("Tax Code Service will not be available")
-
-    # Initialize dispute service
     dispute_service = DisputeService()
-
-    try:
-        logger.info("Initializing Dispute Service...")
-        await dispute_service.initialize()
-        logger.info("Dispute Service initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize Dispute Service: {e}")
-        logger.warning("Dispute Service will not be available")
-
-    # Initialize document service
     document_service = DocumentService()
 
-    try:
-        logger.info("Initializing Document Service...")
-        await document_service.initialize()
-        logger.info("Document Service initialized successfully")
-    except Exception as e:
-        logger.error(f"Failed to initialize Document Service: {e}")
-        logger.warning("Document Service will not be available")
+    # The three loads are independent, so run them concurrently
+    logger.info("Initializing Tax Code, Dispute and Document services...")
+    results = await asyncio.gather(
+        tax_service.initialize(),
+        dispute_service.initialize(),
+        document_service.initialize(),
+        return_exceptions=True
+    )
+
+    for name, result in zip(
+        ("Tax Code Service", "Dispute Service", "Document Service"), results
+    ):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to initialize {name}: {result}")
+            logger.warning(f"{name} will not be available")
+        else:
+            logger.info(f"{name} initialized successfully")
 
     # Initialize orchestrator
     orchestrator = Orchestrator(
@@ -92,6 +96,7 @@ async def initialize_services_background():
     chat.set_orchestrator(orchestrator)
     documents.set_document_service(document_service)
     admin.set_services(tax_service, dispute_service, document_service)
+    health.set_services_ready()
 
     logger.info("All services initialized")
 
@@ -103,11 +108,9 @@ async def lifespan(app: FastAPI):
 
     Note: Service initialization runs in background to allow fast startup
     for Cloud Run health checks. The /health endpoint returns immediately,
-    while /status shows actual service readiness.
+    /v1/ready returns 503 until initialization has finished, and /v1/status
+    shows per-service details.
     """
-    import asyncio
-    from app.db import init_db, close_db
-
     # Startup
     logger.info("Starting Legal AI application...")
 
@@ -122,6 +125,9 @@ async def lifespan(app: FastAPI):
         logger.info("Initializing database...")
         await init_db()
         logger.info("Database initialized successfully")
+
+        # Write-behind persistence for chat usage counters
+        get_usage_limiter().start()
     except Exception as e:
         logger.error(f"Failed to initialize database: {e}")
         logger.warning("Database features will not be available")
@@ -138,6 +144,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down Legal AI application...")
+    health.set_services_ready(False)
+    await get_usage_limiter().stop()
     await close_db()
 
 
@@ -150,6 +158,7 @@ app = FastAPI(
     ),
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_tags=[
@@ -189,7 +198,7 @@ app = FastAPI(
                             "message": "Invalid request parameters",
                             "details": {"field": "message", "issue": "Field required"}
                         },
-                        "request_id": "550e8400-e29b-41d4-a716-446655440000"
+                        "request_id": "550e8400e29b41d4a716446655440000"
                     }
                 }
             }
@@ -204,7 +213,7 @@ app = FastAPI(
                             "message": "Too many requests",
                             "details": {"retry_after": 60}
                         },
-                        "request_id": "550e8400-e29b-41d4-a716-446655440000"
+                        "request_id": "550e8400e29b41d4a716446655440000"
                     }
                 }
             }
@@ -219,7 +228,7 @@ app = FastAPI(
                             "message": "An unexpected error occurred",
                             "details": {}
                         },
-                        "request_id": "550e8400-e29b-41d4-a716-446655440000"
+                        "request_id": "550e8400e29b41d4a716446655440000"
                     }
                 }
             }
@@ -236,109 +245,244 @@ app.state.limiter = limiter
 # ============================================================================
 #
 # Middleware execution order (incoming request):
-# 1. CORS Middleware (outermost layer)
-# 2. Request ID Middleware
+# 1. Request ID Middleware (outermost layer)
+# 2. Health Check Middleware (answers GET /health directly)
 # 3. Logging Middleware
-# 4. Route Handler (with rate limiting)
-# 5. Exception Handlers
+# 4. CORS Middleware
+# 5. Rate Limit Middleware (when RATE_LIMIT_ENABLED)
+# 6. Route Handler
+# 7. Exception Handlers
 #
-# Note: Middleware added with add_middleware() runs before @app.middleware()
+# Note: the last middleware added runs first. Both custom middlewares are
+# plain ASGI classes rather than @app.middleware("http"), which would wrap
+# every request in BaseHTTPMiddleware's Request/Response objects and an
+# anyio stream for the body.
 # ============================================================================
 
 
-# CORS Middleware - Runs first (outermost)
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.get_cors_origins_list(),
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-
-# Request ID Middleware - Runs second
-@app.middleware("http")
-async def add_request_id(request: Request, call_next):
+class RequestIDMiddleware:
     """
     Add unique request ID to each request
     This ID is used for logging and error tracking
     """
-    import uuid
 
-    request_id = str(uuid.uuid4())
-    set_request_id(request_id)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    response = await call_next(request)
-    response.headers["X-Request-ID"] = request_id
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    return response
+        request_id = uuid.uuid4().hex
+        token = set_request_id(request_id)
+        # The context var is reset before ServerErrorMiddleware runs the
+        # generic 500 handler, so keep the ID on the request state as well
+        scope.setdefault("state", {})["request_id"] = request_id
 
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Request-ID"] = request_id
+            await send(message)
 
-# Logging Middleware - Runs third
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+# Body of the root health check, encoded once
+_HEALTH_BODY = b'{"status":"healthy"}'
+_HEALTH_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_HEALTH_BODY)).encode("ascii")),
+]
+
+
+class HealthCheckMiddleware:
+    """
+    Answer GET /health without logging, CORS or routing
+
+    Cloud Run and load balancers probe this every few seconds; the response
+    is constant, so it is sent straight from here. Other methods fall
+    through to the root_health route.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != "/health" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        await send({
+            "type": "http.response.start",
+            "status": 200,
+            # Copied, since outer middleware appends to the list
+            "headers": list(_HEALTH_HEADERS),
+        })
+        await send({"type": "http.response.body", "body": _HEALTH_BODY})
+
+
+class LoggingMiddleware:
     """
     Log all requests with timing
-    Uses request_id set by previous middleware
+    Runs inside RequestIDMiddleware, so log lines carry the request ID
     """
-    start_time = time.time()
 
-    # Process request
-    response = await call_next(request)
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    # Calculate duration
-    duration_ms = (time.time() - start_time) * 1000
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    # Log request
-    logger.info(
-        f"{request.method} {request.url.path} - {response.status_code} ({duration_ms:.2f}ms)"
-    )
+        start_time = time.perf_counter()
+        status_code = None
 
-    return response
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
+        await self.app(scope, receive, send_with_status)
 
-# ============================================================================
-# Register Exception Handlers
-# ============================================================================
+        # Calculate duration (until the response body has been sent)
+        duration_ms = (time.perf_counter() - start_time) * 1000
 
+        # Log request
+        logger.info(
+            "%s %s - %s (%.2fms)",
+            scope["method"], scope["path"], status_code, duration_ms
+        )
 
-# Custom exception handler to ensure all errors include request_id
-@app.exception_handler(Exception)
-async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler that ensures all errors include request_id"""
-    from app.core.logging import request_id_var
 
-    request_id = request_id_var.get()
+class TokenBucket:
+    """Request tokens for one client"""
 
-    # Log the exception
-    logger.error(
-        f"Unhandled exception: {type(exc).__name__}: {str(exc)}",
-        exc_info=True
-    )
+    __slots__ = ("tokens", "updated")
 
-    # Return structured error response
-    return JSONResponse(
-        status_code=500,
-        content={
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred",
-                "details": {"exception": type(exc).__name__}
-            },
-            "request_id": request_id
-        }
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+
+class RateLimitMiddleware:
+    """
+    Per-client-IP rate limiting with token buckets
+
+    Each client may burst up to `requests` requests, refilled at
+    requests/window per second. Only the most recently seen max_clients
+    buckets are kept; an evicted client starts again with a full bucket.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        requests: int,
+        window: int,
+        max_clients: int = 10_000
+    ):
+        """
+        Initialize rate limit middleware
+
+        Args:
+            app: ASGI application to wrap
+            requests: Requests allowed per window (bucket capacity)
+            window: Window length in seconds
+            max_clients: Maximum number of client buckets kept
+        """
+        self.app = app
+        self.capacity = float(requests)
+        self.rate = requests / window
+        self.max_clients = max_clients
+        self._buckets: "OrderedDict[str, TokenBucket]" = OrderedDict()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        key = client[0] if client else ""
+        now = time.monotonic()
+
+        # No await between reading and updating the bucket, so no lock needed
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.capacity, now)
+            self._buckets[key] = bucket
+            if len(self._buckets) > self.max_clients:
+                self._buckets.popitem(last=False)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(self.capacity, bucket.tokens + (now - bucket.updated) * self.rate)
+            bucket.updated = now
+
+        if bucket.tokens < 1:
+            retry_after = math.ceil((1 - bucket.tokens) / self.rate)
+            response = ORJSONResponse(
+                status_code=429,
+                content={
+                    "error": {
+                        "code": "RATE_LIMIT_EXCEEDED",
+                        "message": "Too many requests. Please try again later.",
+                        "details": {"retry_after": retry_after}
+                    },
+                    "request_id": request_id_var.get()
+                },
+                headers={"Retry-After": str(retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        bucket.tokens -= 1
+        await self.app(scope, receive, send)
+
+
+# Rate Limit Middleware (inside CORS, so 429s carry CORS headers and
+# preflights are not counted)
+if settings.rate_limit_enabled:
+    app.add_middleware(
+        RateLimitMiddleware,
+        requests=settings.rate_limit_requests,
+        window=settings.rate_limit_window,
     )
 
+# CORS Middleware
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=settings.get_cors_origins_list(),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Logging Middleware
+app.add_middleware(LoggingMiddleware)
+
+# Health Check Middleware (probes skip logging and routing, keep a request ID)
+app.add_middleware(HealthCheckMiddleware)
+
+# Request ID Middleware (outermost)
+app.add_middleware(RequestIDMiddleware)
+
+
+# ============================================================================
+# Register Exception Handlers
+# ============================================================================
+
 
 # Custom rate limit exception handler with request_id
 @app.exception_handler(RateLimitExceeded)
 async def custom_rate_limit_handler(request: Request, exc: RateLimitExceeded):
     """Rate limit exception handler with structured response"""
-    from app.core.logging import request_id_var
-
     request_id = request_id_var.get()
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=429,
         content={
             "error": {
@@ -360,6 +504,19 @@ register_exception_handlers(app)
 # ============================================================================
 
 
+# Root endpoint body; constant, so encoded once at import
+_ROOT_BODY = orjson.dumps({
+    "name": "Georgian Legal AI API",
+    "name_ka": "ქართული იურიდიული AI API",
+    "version": "1.0.0",
+    "status": "running",
+    "description": "AI-powered legal assistant for Georgian Tax Code and legal research",
+    "description_ka": "ხელოვნური ინტელექტის იურიდიული ასისტენტი საქართველოს საგადასახადო კოდექსისა და სამართლებრივი კვლევებისთვის",
+    "docs": "/docs",
+    "redoc": "/redoc"
+})
+
+
 # Root endpoint
 @app.get("/")
 async def root():
@@ -368,16 +525,7 @@ async def root():
 
     Returns basic API information and documentation links
     """
-    return {
-        "name": "Georgian Legal AI API",
-        "name_ka": "ქართული იურიდიული AI API",
-        "version": "1.0.0",
-        "status": "running",
-        "description": "AI-powered legal assistant for Georgian Tax Code and legal research",
-        "description_ka": "ხელოვნური ინტელექტის იურიდიული ასისტენტი საქართველოს საგადასახადო კოდექსისა და სამართლებრივი კვლევებისთვის",
-        "docs": "/docs",
-        "redoc": "/redoc"
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # Root-level health check for Cloud Run
@@ -387,13 +535,12 @@ async def root_health():
     Root-level health check for Cloud Run and load balancers
 
     This endpoint returns immediately without checking service status.
-    Use /v1/status for detailed service readiness.
+    Use /v1/ready or /v1/status for service readiness.
+
+    GET requests are answered by HealthCheckMiddleware before reaching
+    this route, which keeps the endpoint in the OpenAPI schema.
     """
-    from datetime import datetime
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z"
-    }
+    return {"status": "healthy"}
 
 
 # Include API v1 routers
@@ -442,6 +589,8 @@ app.include_router(
 if __name__ == "__main__":
     import uvicorn
 
+    # loop/http default to "auto", which picks uvloop and httptools when
+    # installed (uvicorn[standard]); the Dockerfile requires them explicitly
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
@@ -25,6 +25,7 @@ from .llm_client import (
 from .orchestrator import Orchestrator
 from .tax_service import TaxCodeService
 from .template_store import TemplateStore
+from .usage_limiter import UsageLimiter, get_usage_limiter
 
 __all__ = [
     # Auth Service
@@ -38,6 +39,9 @@ __all__ = [
     "decode_access_token",
     "hash_password",
     "verify_password",
+    # Usage Limiter
+    "UsageLimiter",
+    "get_usage_limiter",
     # LLM Client
     "LLMClient",
     "GeminiClient",
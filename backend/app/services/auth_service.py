@@ -10,6 +10,7 @@ from passlib.context import CryptContext
 from pydantic import BaseModel, EmailStr
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from app.core import get_logger, get_settings
 from app.db.models import User, UsageRecord
@@ -228,6 +229,28 @@ class AuthService:
         )
         return result.scalar_one_or_none()
 
+    async def get_user_snapshot(self, user_id: str) -> Optional[User]:
+        """
+        Get a read-only, detached copy of a user by ID
+
+        Reads the row's columns with a Core select, skipping the ORM's
+        identity map and loading machinery. For authentication checks that
+        only read the user.
+
+        Returns:
+            Detached User if found, None otherwise
+        """
+        result = await self.session.execute(
+            select(*User.__table__.columns).where(User.id == user_id)
+        )
+        row = result.first()
+        if row is None:
+            return None
+
+        user = User(**row._mapping)
+        make_transient_to_detached(user)
+        return user
+
     async def reset_usage_counters(self, user: User) -> None:
         """Reset usage counters if the reset period has passed"""
         now = datetime.utcnow()
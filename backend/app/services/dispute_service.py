@@ -186,7 +186,7 @@ class DisputeService:
         Returns:
             DisputeResponse with answer and cited cases
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         if not self._initialized:
             await self.initialize()
@@ -199,7 +199,7 @@ class DisputeService:
                 relevant_tax_articles=[],
                 confidence=0.0,
                 model_used="none",
-                processing_time_ms=int((time.time() - start_time) * 1000)
+                processing_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
             )
 
         logger.info(f"Processing dispute query: {question[:100]}...")
@@ -229,7 +229,7 @@ class DisputeService:
                 relevant_tax_articles=[],
                 confidence=0.0,
                 model_used="none",
-                processing_time_ms=int((time.time() - start_time) * 1000)
+                processing_time_ms=(time.perf_counter_ns() - start_ns) // 1_000_000
             )
 
         # Step 4: Convert search results to DisputeCase objects
@@ -248,7 +248,7 @@ class DisputeService:
         # Step 8: Calculate confidence based on relevance scores
         confidence = self._calculate_confidence(dispute_cases)
 
-        processing_time = int((time.time() - start_time) * 1000)
+        processing_time = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         logger.info(f"Query completed in {processing_time}ms")
 
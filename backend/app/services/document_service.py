@@ -22,6 +22,19 @@ from app.services.template_store import TemplateStore
 
 logger = get_logger(__name__)
 
+# Patterns used on every generation, compiled once at import
+_PLACEHOLDER_RE = re.compile(r'\{\{([^{}]+)\}\}|\{([^{}]+)\}')
+_REMAINING_VARIABLE_RE = re.compile(r'\{\{(\w+)\}\}')
+_DATE_PATTERNS = (
+    re.compile(r'^\d{4}-\d{2}-\d{2}$'),  # YYYY-MM-DD
+    re.compile(r'^\d{2}\.\d{2}\.\d{4}$'),  # DD.MM.YYYY
+    re.compile(r'^\d{2}/\d{2}/\d{4}$'),  # DD/MM/YYYY
+)
+_MARKDOWN_HEADER_RE = re.compile(r'^#{1,6}\s+', flags=re.MULTILINE)
+_MARKDOWN_BOLD_RE = re.compile(r'\*\*(.+?)\*\*')
+_MARKDOWN_ITALIC_RE = re.compile(r'\*(.+?)\*')
+_MARKDOWN_LINK_RE = re.compile(r'\[(.+?)\]\(.+?\)')
+
 
 # System prompt for document generation
 DOCUMENT_SYSTEM_PROMPT = """
@@ -164,7 +177,7 @@ class DocumentService:
         Raises:
             ValueError: If template not found or variables missing
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         if not self._initialized:
             await self.initialize()
@@ -257,7 +270,7 @@ class DocumentService:
             # For future implementation
             warnings.append("HTML format not yet implemented, returning markdown")
 
-        processing_time_ms = int((time.time() - start_time) * 1000)
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
         logger.info(
             f"Document generated: {template.id}, "
@@ -275,6 +288,28 @@ class DocumentService:
             warnings=warnings
         )
 
+    async def list_templates_by_type(
+        self,
+        document_type: Optional[str],
+        language: str,
+        limit: Optional[int] = None
+    ) -> List[DocumentTemplate]:
+        """
+        List templates of a document type
+
+        Args:
+            document_type: Document type ID, or None for every type
+            language: Template language
+            limit: Maximum number of templates to return
+
+        Returns:
+            List of templates
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        return self.template_store.list_by_type(language, document_type, limit)
+
     async def list_document_types(self) -> List[DocumentType]:
         """
         List all available document types
@@ -329,13 +364,15 @@ class DocumentService:
         Returns:
             Content with variables replaced
         """
-        content = template
-        for key, value in variables.items():
-            # Replace {{variable}} or {variable}
-            content = content.replace(f"{{{{{key}}}}}", str(value))
-            content = content.replace(f"{{{key}}}", str(value))
+        def replace(match: re.Match) -> str:
+            # Replace {{variable}} or {variable}, leaving unknown names alone
+            key = match.group(1) or match.group(2)
+            if key in variables:
+                return str(variables[key])
+            return match.group(0)
 
-        return content
+        # One pass over the template instead of two per variable
+        return _PLACEHOLDER_RE.sub(replace, template)
 
     def _ensure_variables_replaced(
         self,
@@ -352,23 +389,15 @@ class DocumentService:
         Returns:
             Content with all variables replaced
         """
-        # Find any remaining {{variable}} patterns
-        remaining = re.findall(r'\{\{(\w+)\}\}', content)
-
-        for var_name in remaining:
+        def replace(match: re.Match) -> str:
+            var_name = match.group(1)
             if var_name in variables:
-                content = content.replace(
-                    f"{{{{{var_name}}}}}",
-                    str(variables[var_name])
-                )
-            else:
-                # Replace with placeholder
-                content = content.replace(
-                    f"{{{{{var_name}}}}}",
-                    f"[{var_name}]"
-                )
+                return str(variables[var_name])
+            # Replace with placeholder
+            return f"[{var_name}]"
 
-        return content
+        # Replace any remaining {{variable}} patterns
+        return _REMAINING_VARIABLE_RE.sub(replace, content)
 
     def _is_valid_date(self, value: Any) -> bool:
         """
@@ -384,13 +413,7 @@ class DocumentService:
             return False
 
         # Check common date formats
-        date_patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            r'^\d{2}\.\d{2}\.\d{4}$',  # DD.MM.YYYY
-            r'^\d{2}/\d{2}/\d{4}$',  # DD/MM/YYYY
-        ]
-
-        return any(re.match(pattern, value) for pattern in date_patterns)
+        return any(pattern.match(value) for pattern in _DATE_PATTERNS)
 
     def _markdown_to_plain(self, markdown: str) -> str:
         """
@@ -406,14 +429,14 @@ class DocumentService:
         plain = markdown
 
         # Remove headers
-        plain = re.sub(r'^#{1,6}\s+', '', plain, flags=re.MULTILINE)
+        plain = _MARKDOWN_HEADER_RE.sub('', plain)
 
         # Remove bold/italic
-        plain = re.sub(r'\*\*(.+?)\*\*', r'\1', plain)
-        plain = re.sub(r'\*(.+?)\*', r'\1', plain)
+        plain = _MARKDOWN_BOLD_RE.sub(r'\1', plain)
+        plain = _MARKDOWN_ITALIC_RE.sub(r'\1', plain)
 
         # Remove links
-        plain = re.sub(r'\[(.+?)\]\(.+?\)', r'\1', plain)
+        plain = _MARKDOWN_LINK_RE.sub(r'\1', plain)
 
         return plain
 
@@ -5,7 +5,7 @@ import asyncio
 import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, AsyncIterator, Dict, Optional
 
 import anthropic
 import google.generativeai as genai
@@ -67,6 +67,25 @@ class LLMClient(ABC):
         """
         pass
 
+    async def generate_with_file_stream(
+        self,
+        prompt: str,
+        file_ref: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text response with file context
+
+        Clients without native streaming yield the whole response at once.
+
+        Args:
+            prompt: Input prompt
+            file_ref: File reference (path or uploaded file)
+
+        Yields:
+            Response text chunks
+        """
+        yield await self.generate_with_file(prompt, file_ref)
+
     @abstractmethod
     def get_model_name(self) -> str:
         """
@@ -299,23 +318,7 @@ class GeminiClient(LLMClient):
         start_time = time.time()
 
         try:
-            # Handle file reference
-            if isinstance(file_ref, (str, Path)):
-                file_path = str(file_ref)
-
-                # Check cache
-                if file_path in self._file_cache:
-                    logger.info(f"Using cached file upload: {file_path}")
-                    uploaded_file = self._file_cache[file_path]
-                else:
-                    # Upload file
-                    logger.info(f"Uploading file: {file_path}")
-                    uploaded_file = genai.upload_file(file_path)
-                    self._file_cache[file_path] = uploaded_file
-                    logger.info(f"File uploaded successfully: {uploaded_file.name}")
-            else:
-                # Assume it's already an uploaded file
-                uploaded_file = file_ref
+            uploaded_file = self._resolve_file(file_ref)
 
             # Generate content with file
             async def _generate():
@@ -353,6 +356,96 @@ class GeminiClient(LLMClient):
                 details={"error": str(e)}
             )
 
+    async def generate_with_file_stream(
+        self,
+        prompt: str,
+        file_ref: Any
+    ) -> AsyncIterator[str]:
+        """
+        Stream a text response with file context
+
+        Only opening the stream is retried; once chunks have been yielded
+        a failure is raised as LLMError.
+
+        Args:
+            prompt: Input prompt
+            file_ref: File path or uploaded file reference
+
+        Yields:
+            Response text chunks as they are generated
+        """
+        start_time = time.time()
+
+        try:
+            uploaded_file = self._resolve_file(file_ref)
+
+            # Open the stream with retry logic
+            async def _generate():
+                return await self.model.generate_content_async(
+                    [uploaded_file, prompt],
+                    stream=True
+                )
+
+            response = await self._retry_with_backoff(_generate)
+
+            async for chunk in response:
+                # Chunks without text parts (e.g. final metadata) have no .text
+                if chunk.parts:
+                    yield chunk.text
+
+            # Calculate duration
+            duration_ms = (time.time() - start_time) * 1000
+
+            # Log the request
+            prompt_tokens = response.usage_metadata.prompt_token_count if response.usage_metadata else 0
+            completion_tokens = response.usage_metadata.candidates_token_count if response.usage_metadata else 0
+
+            log_llm_request(
+                logger,
+                provider="gemini",
+                model=self.model_name,
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                duration_ms=duration_ms
+            )
+
+        except (RateLimitError, LLMError):
+            raise
+        except Exception as e:
+            log_error(logger, e, {"prompt_length": len(prompt), "file_ref": str(file_ref)})
+            raise LLMError(
+                message=f"Unexpected error in Gemini generate_with_file_stream: {str(e)}",
+                details={"error": str(e)}
+            )
+
+    def _resolve_file(self, file_ref: Any) -> Any:
+        """
+        Get an uploaded file for a file reference, uploading paths once
+
+        Args:
+            file_ref: File path or uploaded file reference
+
+        Returns:
+            Uploaded file reference
+        """
+        if not isinstance(file_ref, (str, Path)):
+            # Assume it's already an uploaded file
+            return file_ref
+
+        file_path = str(file_ref)
+
+        # Check cache
+        if file_path in self._file_cache:
+            logger.info(f"Using cached file upload: {file_path}")
+            return self._file_cache[file_path]
+
+        # Upload file
+        logger.info(f"Uploading file: {file_path}")
+        uploaded_file = genai.upload_file(file_path)
+        self._file_cache[file_path] = uploaded_file
+        logger.info(f"File uploaded successfully: {uploaded_file.name}")
+        return uploaded_file
+
     def get_model_name(self) -> str:
         """Get the model name being used"""
         return self.model_name
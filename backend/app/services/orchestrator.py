@@ -3,7 +3,7 @@ Main orchestrator service that coordinates all legal AI operations
 """
 import re
 import time
-from typing import Optional
+from typing import AsyncIterator, Optional, Union
 
 from app.core import get_logger
 from app.models import (
@@ -11,6 +11,7 @@ from app.models import (
     DisputeCase,
     QueryMode,
     ResponseSources,
+    TaxResponse,
     UnifiedResponse,
 )
 from app.services.dispute_service import DisputeService
@@ -18,6 +19,9 @@ from app.services.tax_service import TaxCodeService
 
 logger = get_logger(__name__)
 
+# Plain article numbers that exist in the tax code
+_VALID_TAX_ARTICLES = frozenset(map(str, range(1, 310)))
+
 
 class Orchestrator:
     """
@@ -102,7 +106,7 @@ class Orchestrator:
         Raises:
             ValueError: If mode is unsupported or service not available
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         # Auto-classify if mode is AUTO
         if mode == QueryMode.AUTO:
@@ -121,7 +125,7 @@ class Orchestrator:
                 raise ValueError(f"Unsupported mode: {mode}")
 
             # Add processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+            processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
             response.processing_time_ms = processing_time_ms
 
             return response
@@ -130,6 +134,65 @@ class Orchestrator:
             logger.error(f"Error routing query: {e}", exc_info=True)
             raise
 
+    async def route_query_stream(
+        self,
+        message: str,
+        mode: QueryMode,
+        conversation_id: Optional[str] = None,
+        filters: Optional[dict] = None
+    ) -> AsyncIterator[Union[str, UnifiedResponse]]:
+        """
+        Route query and stream the answer as it is generated
+
+        Tax mode streams from the LLM; other modes don't stream yet and
+        yield their whole answer as a single chunk.
+
+        Args:
+            message: User's question/message
+            mode: Query mode (tax, dispute, document, auto)
+            conversation_id: Optional conversation ID for context
+            filters: Optional filters for search
+
+        Yields:
+            Answer text chunks, then the complete UnifiedResponse
+
+        Raises:
+            ValueError: If mode is unsupported or service not available
+        """
+        start_ns = time.perf_counter_ns()
+
+        # Auto-classify if mode is AUTO
+        if mode == QueryMode.AUTO:
+            mode = await self.auto_classify(message)
+            logger.info(f"Auto-classified query as: {mode}")
+
+        if mode != QueryMode.TAX:
+            response = await self.route_query(message, mode, conversation_id, filters)
+            yield response.answer
+            yield response
+            return
+
+        if not self.tax_service:
+            raise ValueError("Tax service not available")
+
+        logger.info("Streaming from tax service")
+
+        try:
+            async for item in self.tax_service.query_stream(
+                question=message,
+                conversation_history=[]  # TODO: Add conversation history support
+            ):
+                if isinstance(item, str):
+                    yield item
+                else:
+                    response = self._tax_to_unified(item)
+                    response.processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                    yield response
+
+        except Exception as e:
+            logger.error(f"Error streaming query: {e}", exc_info=True)
+            raise
+
     async def _route_to_tax(
         self,
         message: str,
@@ -147,7 +210,10 @@ class Orchestrator:
             conversation_history=[]  # TODO: Add conversation history support
         )
 
-        # Convert to unified response
+        return self._tax_to_unified(tax_response)
+
+    def _tax_to_unified(self, tax_response: TaxResponse) -> UnifiedResponse:
+        """Convert a tax service response to a unified response"""
         return UnifiedResponse(
             answer=tax_response.answer,
             mode_used=QueryMode.TAX,
@@ -279,8 +345,8 @@ class Orchestrator:
         invalid_citations = [
             article.article_number
             for article in cited_articles
-            if not article.article_number.replace(".", "").replace("-", "").replace("ა", "").replace("ბ", "").isdigit()
-            or (article.article_number.isdigit() and int(article.article_number) > 309)
+            if article.article_number not in _VALID_TAX_ARTICLES
+            and not self._is_valid_subarticle(article.article_number)
         ]
 
         if invalid_citations:
@@ -290,6 +356,14 @@ class Orchestrator:
 
         return warnings
 
+    @staticmethod
+    def _is_valid_subarticle(article_number: str) -> bool:
+        """Check a citation that isn't a plain article number (e.g. '166.1.ა')"""
+        if article_number.isdigit():
+            # Plain numbers outside the set, e.g. "999"
+            return int(article_number) <= 309
+        return article_number.replace(".", "").replace("-", "").replace("ა", "").replace("ბ", "").isdigit()
+
     def get_status(self) -> dict:
         """
         Get aggregated status from all services
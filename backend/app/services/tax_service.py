@@ -4,7 +4,7 @@ Tax code service for Georgian Tax Code reasoning (Container 1)
 import re
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 from functools import lru_cache
 
 import google.generativeai as genai
@@ -261,27 +261,12 @@ class TaxCodeService:
             LLMError: If query fails
             ConfigurationError: If service not initialized
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
-        # Check if initialized
-        if self.file_upload_status != "ready" or self.uploaded_file is None:
-            logger.error("TaxCodeService not initialized")
-            raise ConfigurationError(
-                message="Tax code service not initialized. Call initialize() first.",
-                details={"status": self.file_upload_status}
-            )
+        self._check_ready()
 
         try:
-            # Format conversation context if provided
-            context = ""
-            if conversation_history:
-                context = self._format_conversation_history(conversation_history)
-
-            # Prepare the full prompt
-            full_prompt = f"{TAX_SYSTEM_PROMPT}\n\n"
-            if context:
-                full_prompt += f"{context}\n"
-            full_prompt += f"კითხვა: {question}"
+            full_prompt = self._build_prompt(question, conversation_history)
 
             logger.info(f"Querying tax code with question length: {len(question)}")
 
@@ -291,27 +276,54 @@ class TaxCodeService:
                 file_ref=self.uploaded_file
             )
 
-            # Extract citations from response
-            citations = self._extract_citations(response_text)
+            return self._build_response(response_text, start_ns)
 
-            # Calculate confidence
-            confidence = self._calculate_confidence(citations)
+        except LLMError:
+            raise
+        except Exception as e:
+            logger.error(f"Error querying tax code: {e}")
+            raise LLMError(
+                message=f"Failed to query tax code: {str(e)}",
+                details={"error": str(e)}
+            )
 
-            # Calculate processing time
-            processing_time_ms = int((time.time() - start_time) * 1000)
+    async def query_stream(
+        self,
+        question: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> AsyncIterator[Union[str, TaxResponse]]:
+        """
+        Query the Georgian Tax Code, streaming the answer as it is generated
 
-            logger.info(
-                f"Tax code query completed in {processing_time_ms}ms "
-                f"with {len(citations)} citations"
-            )
+        Args:
+            question: User's question in Georgian
+            conversation_history: Optional previous conversation messages
 
-            return TaxResponse(
-                answer=response_text,
-                cited_articles=citations,
-                confidence=confidence,
-                model_used=self.llm_client.get_model_name(),
-                processing_time_ms=processing_time_ms
-            )
+        Yields:
+            Answer text chunks, then the complete TaxResponse
+
+        Raises:
+            LLMError: If query fails
+            ConfigurationError: If service not initialized
+        """
+        start_ns = time.perf_counter_ns()
+
+        self._check_ready()
+
+        try:
+            full_prompt = self._build_prompt(question, conversation_history)
+
+            logger.info(f"Streaming tax code query with question length: {len(question)}")
+
+            chunks: List[str] = []
+            async for chunk in self.llm_client.generate_with_file_stream(
+                prompt=full_prompt,
+                file_ref=self.uploaded_file
+            ):
+                chunks.append(chunk)
+                yield chunk
+
+            yield self._build_response("".join(chunks), start_ns)
 
         except LLMError:
             raise
@@ -322,6 +334,79 @@ class TaxCodeService:
                 details={"error": str(e)}
             )
 
+    def _check_ready(self) -> None:
+        """
+        Ensure the tax code file is uploaded
+
+        Raises:
+            ConfigurationError: If service not initialized
+        """
+        if self.file_upload_status != "ready" or self.uploaded_file is None:
+            logger.error("TaxCodeService not initialized")
+            raise ConfigurationError(
+                message="Tax code service not initialized. Call initialize() first.",
+                details={"status": self.file_upload_status}
+            )
+
+    def _build_prompt(
+        self,
+        question: str,
+        conversation_history: Optional[List[Dict[str, str]]] = None
+    ) -> str:
+        """
+        Build the full tax code prompt
+
+        Args:
+            question: User's question
+            conversation_history: Optional previous conversation messages
+
+        Returns:
+            Prompt text
+        """
+        # Format conversation context if provided
+        context = ""
+        if conversation_history:
+            context = self._format_conversation_history(conversation_history)
+
+        full_prompt = f"{TAX_SYSTEM_PROMPT}\n\n"
+        if context:
+            full_prompt += f"{context}\n"
+        full_prompt += f"კითხვა: {question}"
+        return full_prompt
+
+    def _build_response(self, response_text: str, start_ns: int) -> TaxResponse:
+        """
+        Build a TaxResponse with citations from the generated answer
+
+        Args:
+            response_text: Generated answer
+            start_ns: Query start time (time.perf_counter_ns())
+
+        Returns:
+            TaxResponse with answer and citations
+        """
+        # Extract citations from response
+        citations = self._extract_citations(response_text)
+
+        # Calculate confidence
+        confidence = self._calculate_confidence(citations)
+
+        # Calculate processing time
+        processing_time_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        logger.info(
+            f"Tax code query completed in {processing_time_ms}ms "
+            f"with {len(citations)} citations"
+        )
+
+        return TaxResponse(
+            answer=response_text,
+            cited_articles=citations,
+            confidence=confidence,
+            model_used=self.llm_client.get_model_name(),
+            processing_time_ms=processing_time_ms
+        )
+
     def get_status(self) -> Dict[str, Any]:
         """
         Get service status information
@@ -5,15 +5,19 @@ Manages document templates with efficient retrieval and search.
 """
 import re
 import yaml
+from collections import Counter, defaultdict
+from itertools import islice
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from functools import lru_cache
 
 from app.core.logging import get_logger
 from app.models.schemas import DocumentTemplate, DocumentType, TemplateVariable
 
 logger = get_logger(__name__)
 
+# Separator for joined search fields; never part of a query so matches can't span fields
+_SEARCH_FIELD_SEP = "\x00"
+
 
 class TemplateStore:
     """
@@ -35,11 +39,26 @@ class TemplateStore:
         self.types: Dict[str, DocumentType] = {}
         self._initialized = False
 
+        # Template counts by type and language, kept in sync as templates are added/removed
+        self._type_counts: Counter = Counter()
+        self._language_counts: Counter = Counter()
+
+        # Templates by (language, type) in registration order, kept in sync the same way
+        self._by_type: Dict[Tuple[str, str], List[DocumentTemplate]] = defaultdict(list)
+
+        # Lowercased searchable fields per template ID, joined so a search is
+        # one substring test instead of lowering every field per query
+        self._search_text: Dict[str, str] = {}
+
         # Performance optimization: Cache for search results
         self._search_cache: Dict[Tuple, List[DocumentTemplate]] = {}
         self._type_cache: Dict[Tuple, List[DocumentTemplate]] = {}
         self._cache_max_size = 100  # Maximum cache entries
 
+        # Bumped whenever templates or types change, so callers can tell
+        # when anything they derived from the store is stale
+        self.version = 0
+
         logger.info(f"Template store initialized with directory: {templates_dir}")
 
     async def load_templates(self) -> bool:
@@ -80,7 +99,7 @@ class TemplateStore:
                             # Validate and load template
                             if self._validate_template(template_data):
                                 template = DocumentTemplate(**template_data)
-                                self.templates[template.id] = template
+                                self._register_template(template)
                                 logger.debug(f"Loaded template: {template.id}")
                             else:
                                 logger.warning(f"Template validation failed: {template_file.name}")
@@ -93,6 +112,7 @@ class TemplateStore:
                 self._load_default_templates()
 
             self._initialized = True
+            self.version += 1
             return True
 
         except Exception as e:
@@ -231,9 +251,50 @@ class TemplateStore:
             tags=["კონფიდენციალურობა", "NDA", "ხელშეკრულება"]
         )
 
-        self.templates[nda_template.id] = nda_template
+        self._register_template(nda_template)
         logger.info("Loaded 1 default template")
 
+    def _register_template(self, template: DocumentTemplate) -> None:
+        """
+        Put template into the store and update type/language counts
+
+        Args:
+            template: Template to register (replaces any with the same ID)
+        """
+        self._unregister_template(template.id)
+        self.templates[template.id] = template
+        self._type_counts[template.type] += 1
+        self._language_counts[template.language] += 1
+        self._by_type[(template.language, template.type)].append(template)
+        self._search_text[template.id] = _SEARCH_FIELD_SEP.join([
+            template.name_ka, template.name_en, *template.tags, template.category or ""
+        ]).lower()
+        self.version += 1
+
+    def _unregister_template(self, template_id: str) -> Optional[DocumentTemplate]:
+        """
+        Remove template from the store and update type/language counts
+
+        Args:
+            template_id: Template identifier
+
+        Returns:
+            Removed template or None if not present
+        """
+        template = self.templates.pop(template_id, None)
+        if template is not None:
+            self._type_counts[template.type] -= 1
+            if self._type_counts[template.type] <= 0:
+                del self._type_counts[template.type]
+            self._language_counts[template.language] -= 1
+            key = (template.language, template.type)
+            self._by_type[key].remove(template)
+            if not self._by_type[key]:
+                del self._by_type[key]
+            del self._search_text[template_id]
+            self.version += 1
+        return template
+
     def get_template(self, template_id: str) -> Optional[DocumentTemplate]:
         """
         Get template by ID
@@ -282,6 +343,33 @@ class TemplateStore:
 
         return results
 
+    def list_by_type(
+        self,
+        language: str,
+        document_type: Optional[str],
+        limit: Optional[int] = None
+    ) -> List[DocumentTemplate]:
+        """
+        List templates of a type in one language from the type index
+
+        Args:
+            language: Template language ('ka' or 'en')
+            document_type: Document type ID, or None for every type
+            limit: Maximum number of templates to return
+
+        Returns:
+            Matching templates in registration order
+        """
+        if document_type is not None:
+            return self._by_type.get((language, document_type), [])[:limit]
+
+        matches = (t for t in self.templates.values() if t.language == language)
+        if limit is not None and limit < 0:
+            return list(matches)[:limit]
+
+        # Stop at the limit instead of collecting every template in the language
+        return list(islice(matches, limit))
+
     def search_templates(
         self,
         query: str,
@@ -305,22 +393,23 @@ class TemplateStore:
             logger.debug(f"Cache hit for search query: {query}")
             return self._search_cache[cache_key]
 
-        # Compute results
+        # Compute results, scanning only the matching bucket when both filters are set
         query_lower = query.lower()
-        results = []
+        if document_type and language:
+            candidates = self._by_type.get((language, document_type), [])
+        else:
+            candidates = self.templates.values()
 
-        for template in self.templates.values():
+        results = []
+        for template in candidates:
             # Apply filters
             if document_type and template.type != document_type:
                 continue
             if language and template.language != language:
                 continue
 
-            # Check if query matches
-            if (query_lower in template.name_ka.lower() or
-                query_lower in template.name_en.lower() or
-                any(query_lower in tag.lower() for tag in template.tags) or
-                (template.category and query_lower in template.category.lower())):
+            # Check if query matches name, tags or category
+            if query_lower in self._search_text[template.id]:
                 results.append(template)
 
         # Cache results
@@ -339,8 +428,19 @@ class TemplateStore:
         Returns:
             DocumentType or None if not found
         """
+        # Plain dict lookup; not lru_cached since types can be reloaded and the
+        # API already caches serialized responses per store version
         return self.types.get(type_id)
 
+    def get_type_counts(self) -> Dict[str, int]:
+        """
+        Get number of templates per document type
+
+        Returns:
+            Mapping of document type ID to template count
+        """
+        return dict(self._type_counts)
+
     def list_document_types(self) -> List[DocumentType]:
         """
         List all available document types
@@ -369,7 +469,7 @@ class TemplateStore:
             raise ValueError(f"Template validation failed for: {template.id}")
 
         # Add to store
-        self.templates[template.id] = template
+        self._register_template(template)
 
         # Clear cache since we added a new template
         self.clear_cache()
@@ -383,7 +483,7 @@ class TemplateStore:
         except Exception as e:
             logger.error(f"Error saving template {template.id}: {e}")
             # Remove from store if save failed
-            del self.templates[template.id]
+            self._unregister_template(template.id)
             raise
 
         return template.id
@@ -478,8 +578,8 @@ class TemplateStore:
             "types_count": len(self.types),
             "templates_dir": str(self.templates_dir),
             "templates_by_language": {
-                "ka": len([t for t in self.templates.values() if t.language == "ka"]),
-                "en": len([t for t in self.templates.values() if t.language == "en"])
+                "ka": self._language_counts["ka"],
+                "en": self._language_counts["en"]
             },
             "cache_stats": {
                 "search_cache_size": len(self._search_cache),
@@ -0,0 +1,423 @@
+"""
+In-process usage limiter
+
+Keeps per-user daily/monthly request counters in memory so the chat hot
+path doesn't need a locking database round-trip per request. Counters are
+loaded from the users table on first use and written back, together with
+the usage records, by a periodic background flush.
+
+The flush adds this process's increments to the stored counts rather than
+overwriting them, and reloads the totals from the row it updated. Several
+processes therefore share one quota; each one sees the others' requests
+at its next flush.
+"""
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import case, insert, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import get_logger, get_settings
+from app.db import database
+from app.db.models import UsageRecord, User
+
+logger = get_logger(__name__)
+settings = get_settings()
+
+# Number of lock stripes for per-user counter updates
+_LOCK_SHARDS = 16
+
+
+@dataclass
+class _UsageCounters:
+    """In-memory usage counters for one user"""
+    email: str
+    daily_count: int
+    daily_reset_at: datetime
+    monthly_count: int
+    monthly_reset_at: datetime
+    total_count: int
+    # Increments not yet written to the database
+    daily_delta: int = 0
+    monthly_delta: int = 0
+    total_delta: int = 0
+    dirty: bool = False
+    last_used: datetime = field(default_factory=datetime.utcnow)
+    # usage_records rows as plain dicts; ORM objects are only needed to flush
+    pending_records: List[dict] = field(default_factory=list)
+
+
+def _increment_statement(row: dict):
+    """
+    Build the update adding one user's pending increments to the stored counts
+
+    A window reset newer than the stored one replaces the stored count with
+    this process's increments since the reset. Otherwise the increments are
+    added, so concurrent processes and admin edits are not overwritten.
+
+    Args:
+        row: Collected increments and window starts for one user
+
+    Returns:
+        UPDATE statement returning the stored counters
+    """
+    daily_reset = User.daily_requests_reset_at < row["daily_reset_at"]
+    monthly_reset = User.monthly_requests_reset_at < row["monthly_reset_at"]
+
+    return (
+        update(User)
+        .where(User.id == row["id"])
+        .values(
+            daily_requests_count=case(
+                (daily_reset, row["daily_delta"]),
+                else_=User.daily_requests_count + row["daily_delta"],
+            ),
+            daily_requests_reset_at=case(
+                (daily_reset, row["daily_reset_at"]),
+                else_=User.daily_requests_reset_at,
+            ),
+            monthly_requests_count=case(
+                (monthly_reset, row["monthly_delta"]),
+                else_=User.monthly_requests_count + row["monthly_delta"],
+            ),
+            monthly_requests_reset_at=case(
+                (monthly_reset, row["monthly_reset_at"]),
+                else_=User.monthly_requests_reset_at,
+            ),
+            total_requests_count=User.total_requests_count + row["total_delta"],
+        )
+        .returning(
+            User.daily_requests_count,
+            User.daily_requests_reset_at,
+            User.monthly_requests_count,
+            User.monthly_requests_reset_at,
+            User.total_requests_count,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+class UsageLimiter:
+    """
+    Per-user request limiter with write-behind persistence
+
+    Applies the same daily/monthly windows and limits as
+    AuthService.check_and_increment_usage.
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = 5.0,
+        flush_max_pending: int = 100,
+        idle_ttl: float = 300.0
+    ):
+        """
+        Initialize usage limiter
+
+        Args:
+            flush_interval: Seconds between background flushes
+            flush_max_pending: Pending usage records that trigger an early flush
+            idle_ttl: Seconds after which clean, unused counters are dropped
+        """
+        self.flush_interval = flush_interval
+        self.flush_max_pending = flush_max_pending
+        self.idle_ttl = idle_ttl
+
+        self._counters: Dict[str, _UsageCounters] = {}
+        self._locks = [asyncio.Lock() for _ in range(_LOCK_SHARDS)]
+        self._flush_lock = asyncio.Lock()
+        self._pending = 0
+        self._flush_task: Optional[asyncio.Task] = None
+        self._early_flush: Optional[asyncio.Task] = None
+
+    def _lock_for(self, user_id: str) -> asyncio.Lock:
+        """Get the lock stripe for a user"""
+        return self._locks[hash(user_id) % _LOCK_SHARDS]
+
+    async def _load(self, session: AsyncSession, user_id: str) -> Optional[_UsageCounters]:
+        """Load a user's counters from the database"""
+        result = await session.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        if not user:
+            return None
+
+        return _UsageCounters(
+            email=user.email,
+            daily_count=user.daily_requests_count,
+            daily_reset_at=user.daily_requests_reset_at,
+            monthly_count=user.monthly_requests_count,
+            monthly_reset_at=user.monthly_requests_reset_at,
+            total_count=user.total_requests_count,
+        )
+
+    async def check_and_increment(
+        self,
+        session: AsyncSession,
+        user_id: str,
+        endpoint: str,
+        request_type: str = "chat",
+    ) -> Tuple[bool, str, Tuple[int, int]]:
+        """
+        Check usage limits and increment if allowed
+
+        Args:
+            session: Database session, only used to load unseen users
+            user_id: User ID
+            endpoint: Endpoint being called
+            request_type: Request type for the usage record
+
+        Returns:
+            Tuple of (is_allowed, reason_if_not_allowed, (daily_used, monthly_used))
+        """
+        async with self._lock_for(user_id):
+            counters = self._counters.get(user_id)
+            if counters is None:
+                counters = await self._load(session, user_id)
+                if counters is None:
+                    return False, "User not found", (0, 0)
+                self._counters[user_id] = counters
+
+            now = datetime.utcnow()
+            counters.last_used = now
+
+            # Reset daily counter if a day has passed
+            if (now - counters.daily_reset_at).days >= 1:
+                counters.daily_count = 0
+                counters.daily_delta = 0
+                counters.daily_reset_at = now
+                counters.dirty = True
+                logger.info("Daily counter reset for user %s", counters.email)
+
+            # Reset monthly counter if a month has passed
+            if (now - counters.monthly_reset_at).days >= 30:
+                counters.monthly_count = 0
+                counters.monthly_delta = 0
+                counters.monthly_reset_at = now
+                counters.dirty = True
+                logger.info("Monthly counter reset for user %s", counters.email)
+
+            usage = (counters.daily_count, counters.monthly_count)
+
+            if counters.daily_count >= settings.daily_request_limit:
+                return False, "Daily request limit reached", usage
+
+            if counters.monthly_count >= settings.monthly_request_limit:
+                return False, "Monthly request limit reached", usage
+
+            counters.daily_count += 1
+            counters.monthly_count += 1
+            counters.total_count += 1
+            counters.daily_delta += 1
+            counters.monthly_delta += 1
+            counters.total_delta += 1
+            counters.dirty = True
+            counters.pending_records.append({
+                "user_id": user_id,
+                "endpoint": endpoint,
+                "request_type": request_type,
+                "created_at": now,
+            })
+            self._pending += 1
+            usage = (counters.daily_count, counters.monthly_count)
+
+        if self._pending >= self.flush_max_pending:
+            self._schedule_flush()
+
+        return True, "", usage
+
+    def _schedule_flush(self) -> None:
+        """Start a flush in the background unless one is already queued"""
+        if self._early_flush is None or self._early_flush.done():
+            self._early_flush = asyncio.create_task(self.flush())
+
+    def _take_pending(self, user_id: str, counters: _UsageCounters) -> Tuple[dict, List[dict]]:
+        """Take a dirty user's increments and pending records for a flush"""
+        row = {
+            "id": user_id,
+            "daily_delta": counters.daily_delta,
+            "daily_reset_at": counters.daily_reset_at,
+            "monthly_delta": counters.monthly_delta,
+            "monthly_reset_at": counters.monthly_reset_at,
+            "total_delta": counters.total_delta,
+        }
+        records = counters.pending_records
+        counters.pending_records = []
+        counters.daily_delta = counters.monthly_delta = counters.total_delta = 0
+        counters.dirty = False
+        return row, records
+
+    def _collect(self) -> Tuple[List[dict], List[dict]]:
+        """Take dirty counters and pending records, dropping idle entries"""
+        now = datetime.utcnow()
+        rows: List[dict] = []
+        records: List[dict] = []
+
+        for user_id, counters in list(self._counters.items()):
+            if counters.dirty:
+                row, user_records = self._take_pending(user_id, counters)
+                rows.append(row)
+                records.extend(user_records)
+            elif (now - counters.last_used).total_seconds() > self.idle_ttl:
+                del self._counters[user_id]
+
+        self._pending = 0
+        return rows, records
+
+    async def flush(self) -> None:
+        """Write dirty counters and pending usage records to the database"""
+        async with self._flush_lock:
+            # Snapshot under every stripe so no increment is half-collected
+            for lock in self._locks:
+                await lock.acquire()
+            try:
+                rows, records = self._collect()
+            finally:
+                for lock in self._locks:
+                    lock.release()
+
+            await self._write(rows, records)
+
+    async def flush_user(self, user_id: str) -> None:
+        """
+        Write one user's pending counters and usage records to the database
+
+        Lets endpoints that report a user's usage read current counts
+        without flushing every other user.
+
+        Args:
+            user_id: User ID
+        """
+        async with self._flush_lock:
+            async with self._lock_for(user_id):
+                counters = self._counters.get(user_id)
+                if counters is None or not counters.dirty:
+                    return
+                row, records = self._take_pending(user_id, counters)
+                self._pending -= len(records)
+
+            await self._write([row], records)
+
+    async def _write(self, rows: List[dict], records: List[dict]) -> None:
+        """Apply collected increments and insert usage records, then reconcile"""
+        if not rows:
+            return
+
+        if not database.AsyncSessionLocal:
+            logger.warning("Database not initialized, dropping %d usage updates", len(rows))
+            return
+
+        try:
+            async with database.AsyncSessionLocal() as session:
+                stored = {}
+                for row in rows:
+                    result = await session.execute(_increment_statement(row))
+                    stored[row["id"]] = result.one_or_none()
+                if records:
+                    # One executemany insert instead of a unit of work per record
+                    await session.execute(insert(UsageRecord), records)
+                await session.commit()
+            logger.debug("Flushed usage for %d users (%d records)", len(rows), len(records))
+        except Exception as e:
+            logger.error("Failed to flush usage counters: %s", e)
+            self._requeue(rows, records)
+            return
+
+        await self._reconcile(stored)
+
+    async def _reconcile(self, stored: Dict[str, Optional[Row]]) -> None:
+        """
+        Replace in-memory counters with the stored totals from a flush
+
+        Increments made while the flush ran are added on top. A window that
+        was reset locally after the flush snapshot keeps its local count.
+
+        Args:
+            stored: Updated users row per user ID (None if the user is gone)
+        """
+        for user_id, row in stored.items():
+            async with self._lock_for(user_id):
+                counters = self._counters.get(user_id)
+                if counters is None:
+                    continue
+                if row is None:
+                    del self._counters[user_id]
+                    continue
+
+                if counters.daily_reset_at <= row.daily_requests_reset_at:
+                    counters.daily_count = row.daily_requests_count + counters.daily_delta
+                    counters.daily_reset_at = row.daily_requests_reset_at
+                if counters.monthly_reset_at <= row.monthly_requests_reset_at:
+                    counters.monthly_count = row.monthly_requests_count + counters.monthly_delta
+                    counters.monthly_reset_at = row.monthly_requests_reset_at
+                counters.total_count = row.total_requests_count + counters.total_delta
+
+    def _requeue(self, rows: List[dict], records: List[dict]) -> None:
+        """Put increments and records from a failed flush back as pending"""
+        by_user: Dict[str, List[dict]] = {}
+        for record in records:
+            by_user.setdefault(record["user_id"], []).append(record)
+
+        for row in rows:
+            counters = self._counters.get(row["id"])
+            if counters is None:
+                continue
+            counters.dirty = True
+            # Increments from a window that has since been reset are dropped
+            if counters.daily_reset_at == row["daily_reset_at"]:
+                counters.daily_delta += row["daily_delta"]
+            if counters.monthly_reset_at == row["monthly_reset_at"]:
+                counters.monthly_delta += row["monthly_delta"]
+            counters.total_delta += row["total_delta"]
+            counters.pending_records[:0] = by_user.get(row["id"], [])
+            self._pending += len(by_user.get(row["id"], []))
+
+    async def _flush_loop(self) -> None:
+        """Flush periodically until cancelled"""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def start(self) -> None:
+        """Start the background flush loop (requires a running event loop)"""
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            logger.info("Usage limiter started (flush every %.1fs)", self.flush_interval)
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write out anything pending"""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.flush()
+
+    def get_status(self) -> dict:
+        """
+        Get limiter status
+
+        Returns:
+            Status dictionary
+        """
+        return {
+            "tracked_users": len(self._counters),
+            "pending_records": self._pending,
+            "flush_interval": self.flush_interval,
+        }
+
+
+# Global instance
+_usage_limiter: Optional[UsageLimiter] = None
+
+
+def get_usage_limiter() -> UsageLimiter:
+    """Get or create the global usage limiter"""
+    global _usage_limiter
+    if _usage_limiter is None:
+        _usage_limiter = UsageLimiter(
+            flush_interval=settings.usage_flush_interval_seconds,
+            flush_max_pending=settings.usage_flush_max_pending,
+        )
+    return _usage_limiter
@@ -1,9 +1,10 @@
 """
 In-memory conversation storage with TTL for Phase 1
 """
+import heapq
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from app.core import get_logger
 
@@ -18,7 +19,10 @@ class ConversationStore:
     - Stores conversations in memory
     - Automatic expiration after 24 hours
     - Maximum 100 conversations per instance
-    - Thread-safe operations
+    - Accessed only from the event loop, so operations need no locking
+
+    Conversations are per process; running several workers requires
+    sticky sessions or a shared backend.
     """
 
     # Configuration
@@ -90,6 +94,23 @@ class ConversationStore:
             role: Message role ('user' or 'assistant')
             content: Message content
 
+        Returns:
+            True if successful, False if conversation not found
+        """
+        return self.add_messages(conversation_id, [(role, content)])
+
+    def add_messages(
+        self,
+        conversation_id: str,
+        messages: List[Tuple[str, str]]
+    ) -> bool:
+        """
+        Add several messages to a conversation with a single lookup
+
+        Args:
+            conversation_id: Conversation ID
+            messages: (role, content) pairs in order
+
         Returns:
             True if successful, False if conversation not found
         """
@@ -97,18 +118,29 @@ class ConversationStore:
         if not conversation:
             return False
 
-        # Add message
-        message = {
-            "role": role,
-            "content": content,
-            "timestamp": datetime.utcnow().isoformat() + "Z"
-        }
-        conversation["messages"].append(message)
-        conversation["updated_at"] = datetime.utcnow()
+        now = datetime.utcnow()
+        timestamp = now.isoformat() + "Z"
+        conversation["messages"].extend(
+            {"role": role, "content": content, "timestamp": timestamp}
+            for role, content in messages
+        )
+        conversation["updated_at"] = now
 
-        logger.debug(f"Added message to conversation {conversation_id}")
+        logger.debug("Added %d messages to conversation %s", len(messages), conversation_id)
         return True
 
+    def exists(self, conversation_id: str) -> bool:
+        """
+        Check whether a conversation exists and hasn't expired
+
+        Args:
+            conversation_id: Conversation ID
+
+        Returns:
+            True if the conversation is available
+        """
+        return self.get_conversation(conversation_id) is not None
+
     def get_conversation(self, conversation_id: str) -> Optional[dict]:
         """
         Get a conversation by ID
@@ -165,28 +197,36 @@ class ConversationStore:
         # Clean up expired conversations
         self._cleanup_expired()
 
-        # Get all conversations sorted by updated_at (most recent first)
-        conversations = sorted(
+        # Most recently updated first; only the requested page is ordered
+        conversations = heapq.nlargest(
+            offset + limit,
             self._conversations.values(),
-            key=lambda c: c["updated_at"],
-            reverse=True
-        )
-
-        # Apply pagination
-        conversations = conversations[offset:offset + limit]
+            key=lambda c: c["updated_at"]
+        )[offset:]
 
         # Return summaries (without messages)
-        summaries = []
-        for conv in conversations:
-            summaries.append({
+        return [
+            {
                 "conversation_id": conv["conversation_id"],
                 "created_at": conv["created_at"].isoformat() + "Z",
                 "updated_at": conv["updated_at"].isoformat() + "Z",
                 "message_count": len(conv["messages"]),
                 "expires_at": conv["expires_at"].isoformat() + "Z"
-            })
+            }
+            for conv in conversations
+        ]
+
+    def count_conversations(self) -> int:
+        """
+        Count stored conversations
+
+        Expired conversations are only dropped on cleanup, so call this
+        after list_conversations for a count that matches the listing.
 
-        return summaries
+        Returns:
+            Number of conversations
+        """
+        return len(self._conversations)
 
     def delete_conversation(self, conversation_id: str) -> bool:
         """
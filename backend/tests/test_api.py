@@ -5,7 +5,8 @@ API endpoint tests - testing FastAPI routes
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import AsyncMock, patch, Mock
-from app.main import app
+from app.core.logging import request_id_var
+from app.main import RateLimitMiddleware, app
 
 
 @pytest.fixture
@@ -200,6 +201,33 @@ class TestRateLimiting:
         # At least one should be rate limited (429)
         assert 429 in responses
 
+    def test_token_bucket_limits_per_client(self):
+        """Test the rate limit middleware allows a burst, then returns 429"""
+        async def ok_app(scope, receive, send):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": b""})
+
+        limited = TestClient(RateLimitMiddleware(ok_app, requests=2, window=60))
+
+        assert limited.get("/").status_code == 200
+        assert limited.get("/").status_code == 200
+
+        response = limited.get("/")
+        assert response.status_code == 429
+        assert response.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert int(response.headers["retry-after"]) >= 1
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_evicts_oldest_client(self):
+        """Test only the most recently seen client buckets are kept"""
+        middleware = RateLimitMiddleware(AsyncMock(), requests=1, window=60, max_clients=2)
+
+        for host in ("10.0.0.1", "10.0.0.2", "10.0.0.3"):
+            scope = {"type": "http", "client": (host, 1234)}
+            await middleware(scope, AsyncMock(), AsyncMock())
+
+        assert list(middleware._buckets) == ["10.0.0.2", "10.0.0.3"]
+
 
 class TestErrorResponses:
     """Test error handling"""
@@ -244,6 +272,25 @@ class TestErrorResponses:
         data = response.json()
         assert "detail" in data or "error" in data
 
+    def test_unhandled_error_keeps_request_id(self):
+        """Test the generic 500 handler reports and logs the request ID"""
+        @app.get("/test-unhandled-error")
+        async def raise_error():
+            raise RuntimeError("boom")
+
+        logged_ids = []
+        try:
+            with patch('app.core.exceptions.logger') as mock_logger:
+                mock_logger.error.side_effect = lambda *args, **kwargs: logged_ids.append(request_id_var.get())
+                response = TestClient(app, raise_server_exceptions=False).get("/test-unhandled-error")
+        finally:
+            app.router.routes.pop()
+
+        assert response.status_code == 500
+        request_id = response.json()["request_id"]
+        assert request_id is not None
+        assert logged_ids == [request_id]
+
 
 class TestCORSHeaders:
     """Test CORS configuration"""
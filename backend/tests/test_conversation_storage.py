@@ -470,3 +470,46 @@ class TestConversationStoreIntegration:
 
         assert response_a.status_code == 200
         assert response_b.status_code == 200
+
+
+class TestBulkMessages:
+    """Test adding several messages at once"""
+
+    @pytest.fixture
+    def store(self):
+        """Create a fresh conversation store"""
+        from app.storage.conversation_store import ConversationStore
+        return ConversationStore()
+
+    @pytest.mark.unit
+    def test_add_messages_in_order(self, store):
+        """Should append all messages in order with one timestamp"""
+        conv_id = store.create_conversation()
+
+        assert store.add_messages(conv_id, [("user", "Question"), ("assistant", "Answer")])
+
+        messages = store.get_messages(conv_id)
+        assert [(m["role"], m["content"]) for m in messages] == [
+            ("user", "Question"),
+            ("assistant", "Answer"),
+        ]
+        assert messages[0]["timestamp"] == messages[1]["timestamp"]
+
+    @pytest.mark.unit
+    def test_add_messages_unknown_conversation(self, store):
+        """Should return False for a missing conversation"""
+        assert store.add_messages("missing", [("user", "Question")]) is False
+        assert store.exists("missing") is False
+
+    @pytest.mark.unit
+    def test_list_page_and_count(self, store):
+        """Should page by most recent update and count all conversations"""
+        ids = [store.create_conversation() for _ in range(5)]
+        store.add_messages(ids[1], [("user", "Bump")])
+
+        page = store.list_conversations(limit=2, offset=0)
+
+        assert len(page) == 2
+        assert page[0]["conversation_id"] == ids[1]
+        assert page[0]["message_count"] == 1
+        assert store.count_conversations() == 5
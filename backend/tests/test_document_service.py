@@ -10,6 +10,7 @@ from app.services.template_store import TemplateStore
 from app.models.schemas import (
     DocumentGenerationRequest,
     DocumentTemplate,
+    DocumentType,
     TemplateVariable,
     GeneratedDocument,
 )
@@ -25,6 +26,27 @@ class TestTemplateStore:
         templates_dir.mkdir()
         return TemplateStore(templates_dir=str(templates_dir))
 
+    @pytest.fixture
+    def nda_template(self):
+        """Create an NDA template; tests derive variants with model_copy"""
+        return DocumentTemplate(
+            id="test_nda_ka",
+            type="nda",
+            name_ka="ტესტური NDA",
+            name_en="Test NDA",
+            language="ka",
+            content="{{party_name}}",
+            variables=[
+                TemplateVariable(
+                    name="party_name",
+                    label_ka="მხარე",
+                    label_en="Party",
+                    type="text",
+                    required=True
+                )
+            ]
+        )
+
     @pytest.fixture
     def sample_template_yaml(self, tmp_path):
         """Create sample YAML template file"""
@@ -117,6 +139,55 @@ content: |
         results = template_store.search_templates(query="nonexistent")
         assert len(results) == 0
 
+    @pytest.mark.asyncio
+    async def test_type_counts(self, template_store, nda_template):
+        """Test template counts by type track additions"""
+        await template_store.add_template(nda_template)
+        await template_store.add_template(nda_template.model_copy(update={"id": "test_nda_ka_02"}))
+        assert template_store.get_type_counts() == {"nda": 2}
+
+        # Re-adding an existing ID replaces it rather than double-counting
+        await template_store.add_template(nda_template.model_copy(update={"type": "loan"}))
+        assert template_store.get_type_counts() == {"nda": 1, "loan": 1}
+        assert template_store.get_status()["templates_by_language"] == {"ka": 2, "en": 0}
+
+    @pytest.mark.asyncio
+    async def test_list_by_type(self, template_store, nda_template):
+        """Test the type index follows additions and replacements"""
+        await template_store.add_template(nda_template)
+        await template_store.add_template(nda_template.model_copy(update={"id": "test_nda_ka_02"}))
+        await template_store.add_template(nda_template.model_copy(update={"id": "test_nda_en", "language": "en"}))
+
+        assert [t.id for t in template_store.list_by_type("ka", "nda")] == ["test_nda_ka", "test_nda_ka_02"]
+        assert [t.id for t in template_store.list_by_type("ka", "nda", limit=1)] == ["test_nda_ka"]
+        assert [t.id for t in template_store.list_by_type("en", "nda")] == ["test_nda_en"]
+        assert [t.id for t in template_store.list_by_type("ka", None)] == ["test_nda_ka", "test_nda_ka_02"]
+        assert [t.id for t in template_store.list_by_type("ka", None, limit=1)] == ["test_nda_ka"]
+
+        # Changing a template's type moves it to the new type's entry
+        await template_store.add_template(nda_template.model_copy(update={"type": "loan"}))
+        assert [t.id for t in template_store.list_by_type("ka", "nda")] == ["test_nda_ka_02"]
+        assert [t.id for t in template_store.list_by_type("ka", "loan")] == ["test_nda_ka"]
+
+    @pytest.mark.asyncio
+    async def test_search_matches_fields(self, template_store, nda_template):
+        """Test search matches names, tags and category and follows replacements"""
+        template = nda_template.model_copy(
+            update={"category": "Confidentiality", "tags": ["Secret"]}
+        )
+
+        await template_store.add_template(template)
+        await template_store.add_template(template.model_copy(update={"id": "test_nda_en", "language": "en"}))
+
+        assert [t.id for t in template_store.search_templates("test nda")] == ["test_nda_ka", "test_nda_en"]
+        assert [t.id for t in template_store.search_templates("secret", "nda", "en")] == ["test_nda_en"]
+        assert [t.id for t in template_store.search_templates("confidential", language="ka")] == ["test_nda_ka"]
+        assert template_store.search_templates("ndaconf") == []
+
+        # Replaced templates are searched by their new fields
+        await template_store.add_template(template.model_copy(update={"tags": ["private"]}))
+        assert [t.id for t in template_store.search_templates("secret")] == ["test_nda_en"]
+
 
 class TestDocumentService:
     """Test document generation service"""
@@ -345,6 +416,20 @@ class TestDocumentService:
         assert document_service._is_valid_date("2024-13-01") == True  # Regex doesn't validate ranges
         assert document_service._is_valid_date(12345) == False
 
+    def test_placeholder_substitution(self, document_service):
+        """Test both placeholder styles are replaced and unknown names kept"""
+        content = document_service._simple_substitution(
+            "{{party_a}} / {party_b} / {{missing}} / {{party_a}}",
+            {"party_a": "A", "party_b": 2}
+        )
+        assert content == "A / 2 / {{missing}} / A"
+
+        content = document_service._ensure_variables_replaced(
+            "{{party_a}} and {{missing}}",
+            {"party_a": "A"}
+        )
+        assert content == "A and [missing]"
+
     def test_markdown_to_plain(self, document_service):
         """Test markdown to plain text conversion"""
         markdown = """# Header 1
@@ -481,3 +566,207 @@ content: |
         assert "2024-01-01" in document.content
         assert document.disclaimer in document.content
         assert "კონფიდენციალურობის ხელშეკრულება" in document.content
+
+
+class TestDocumentStore:
+    """Test in-memory generated document storage"""
+
+    @pytest.fixture
+    def document(self):
+        """Create a generated document"""
+        return GeneratedDocument(
+            content="content",
+            document_type="nda",
+            template_used="nda_test",
+            variables_used={},
+            disclaimer="disclaimer",
+        )
+
+    def test_expired_documents_cleaned(self, document):
+        """Test expired documents are removed and fresh ones kept"""
+        from datetime import datetime, timedelta
+        from app.api.v1.documents import DocumentStore
+
+        store = DocumentStore(max_size=10, ttl_seconds=3600)
+        old_ids = [store.store(document) for _ in range(3)]
+        for doc_id in old_ids:
+            store.documents[doc_id].expires_at = datetime.utcnow() - timedelta(seconds=1)
+
+        new_id = store.store(document)
+
+        assert list(store.documents) == [new_id]
+        assert store.retrieve(new_id) is document
+
+    def test_size_limit_evicts_oldest(self, document):
+        """Test the oldest document is evicted when full"""
+        from app.api.v1.documents import DocumentStore
+
+        store = DocumentStore(max_size=2, ttl_seconds=3600)
+        ids = [store.store(document) for _ in range(3)]
+
+        assert list(store.documents) == ids[1:]
+
+    def test_document_ids_are_unique_uuid4(self, document):
+        """Test batched document IDs are distinct version 4 UUIDs"""
+        import uuid
+        from app.api.v1.documents import DocumentStore, _ID_BATCH_SIZE
+
+        store = DocumentStore(max_size=1000, ttl_seconds=3600)
+        ids = [store.store(document) for _ in range(_ID_BATCH_SIZE * 2 + 1)]
+
+        assert len(set(ids)) == len(ids)
+        assert all(uuid.UUID(document_id).version == 4 for document_id in ids)
+
+    @pytest.mark.asyncio
+    async def test_docx_converted_once(self, document):
+        """Test concurrent DOCX downloads share a single conversion"""
+        import asyncio
+        from app.api.v1 import documents
+
+        store = documents.DocumentStore(max_size=10, ttl_seconds=3600)
+        stored = store.get(store.store(document))
+
+        with patch.dict(documents._docx_cache, clear=True), \
+                patch.object(documents, "markdown_to_docx", return_value=b"docx") as convert:
+            results = await asyncio.gather(*[documents._get_docx(stored) for _ in range(3)])
+            again = await documents._get_docx(stored)
+
+        assert results == [b"docx"] * 3
+        assert again == b"docx"
+        convert.assert_called_once_with("content")
+
+    @pytest.mark.asyncio
+    async def test_docx_reused_for_identical_content(self, document):
+        """Test documents with the same content reuse one DOCX conversion"""
+        from app.api.v1 import documents
+
+        store = documents.DocumentStore(max_size=10, ttl_seconds=3600)
+        first = store.get(store.store(document))
+        second = store.get(store.store(document))
+
+        with patch.dict(documents._docx_cache, clear=True), \
+                patch.object(documents, "markdown_to_docx", return_value=b"docx") as convert:
+            assert await documents._get_docx(first) == b"docx"
+            assert await documents._get_docx(second) == b"docx"
+
+        convert.assert_called_once_with("content")
+
+
+class TestMarkdownToDocx:
+    """Test markdown to DOCX conversion"""
+
+    def test_line_formats(self):
+        """Test each supported line format maps to the right paragraph"""
+        import io
+        from docx import Document
+        from app.api.v1.documents import markdown_to_docx
+
+        markdown = "\n".join([
+            "# სათაური",
+            "## Section",
+            "**Bold line**",
+            "---",
+            "- bullet",
+            "12. numbered",
+            "text with **bold** word",
+            "#not a heading",
+        ])
+
+        doc = Document(io.BytesIO(markdown_to_docx(markdown)))
+        paragraphs = [(p.style.name, p.text) for p in doc.paragraphs]
+
+        assert paragraphs == [
+            ("Heading 1", "სათაური"),
+            ("Heading 2", "Section"),
+            ("Normal", "Bold line"),
+            ("Normal", "_" * 50),
+            ("List Bullet", "bullet"),
+            ("List Number", "numbered"),
+            ("Normal", "text with bold word"),
+            ("Normal", "#not a heading"),
+        ]
+        assert doc.paragraphs[6].runs[1].bold
+
+
+class TestListingCache:
+    """Test cached type/template listing responses"""
+
+    @pytest.mark.asyncio
+    async def test_rebuilds_when_templates_change(self):
+        """Test cached listings are reused until the store version changes"""
+        from app.api.v1 import documents
+
+        service = Mock()
+        service.template_store = Mock(version=1)
+        documents.set_document_service(service)
+
+        builds = []
+
+        async def build():
+            builds.append(1)
+            return documents.DocumentTypesResponse(types=[], total=len(builds))
+
+        try:
+            first = await documents._cached_json_response(("types",), build)
+            second = await documents._cached_json_response(("types",), build)
+            service.template_store.version = 2
+            third = await documents._cached_json_response(("types",), build)
+        finally:
+            documents.set_document_service(None)
+
+        assert len(builds) == 2
+        assert first.body == second.body == b'{"types":[],"total":1}'
+        assert third.body == b'{"types":[],"total":2}'
+
+    @pytest.mark.asyncio
+    async def test_document_type_served_from_cache(self):
+        """Test document types are serialized once and missing types still 404"""
+        from fastapi import HTTPException
+        from app.api.v1 import documents
+
+        doc_type = DocumentType(id="nda", name_ka="NDA", name_en="NDA", description_ka="NDA")
+        service = Mock()
+        service.template_store = Mock(version=1)
+        service.template_store.get_document_type.side_effect = (
+            lambda type_id: doc_type if type_id == "nda" else None
+        )
+        documents.set_document_service(service)
+
+        try:
+            first = await documents.get_document_type("nda", current_user=None, if_none_match=None)
+            second = await documents.get_document_type("nda", current_user=None, if_none_match=None)
+            with pytest.raises(HTTPException) as exc_info:
+                await documents.get_document_type("missing", current_user=None, if_none_match=None)
+        finally:
+            documents.set_document_service(None)
+
+        assert first.body == second.body == doc_type.model_dump_json().encode()
+        assert service.template_store.get_document_type.call_count == 2
+        assert exc_info.value.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_etag_not_modified(self):
+        """Test a matching If-None-Match gets an empty 304 and a stale one the body"""
+        from app.api.v1 import documents
+
+        service = Mock()
+        service.template_store = Mock(version=1)
+        documents.set_document_service(service)
+
+        async def build():
+            return documents.DocumentTypesResponse(types=[], total=0)
+
+        try:
+            first = await documents._cached_json_response(("types",), build)
+            etag = first.headers["etag"]
+            cached = await documents._cached_json_response(("types",), build, f'"stale", W/{etag}')
+            stale = await documents._cached_json_response(("types",), build, '"stale"')
+            anything = await documents._cached_json_response(("types",), build, "*")
+        finally:
+            documents.set_document_service(None)
+
+        assert first.status_code == 200
+        assert cached.status_code == 304 and cached.body == b""
+        assert cached.headers["etag"] == etag
+        assert stale.status_code == 200 and stale.body == first.body
+        assert anything.status_code == 304
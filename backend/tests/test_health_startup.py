@@ -58,6 +58,18 @@ class TestHealthEndpoint:
         assert response.status_code == 200
         assert "application/json" in response.headers.get("content-type", "")
 
+    @pytest.mark.unit
+    def test_health_probe_not_logged(self, client):
+        """Health probes are answered before the request logging middleware"""
+        import app.main as main
+
+        with patch.object(main.logger, "info") as mock_info:
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "x-request-id" in response.headers
+        assert not any("/health" in str(call) for call in mock_info.call_args_list)
+
 
 class TestStatusEndpoint:
     """Test /v1/status endpoint - Detailed service status for monitoring"""
@@ -93,6 +105,30 @@ class TestStatusEndpoint:
         assert isinstance(data, dict)
 
 
+class TestReadinessEndpoint:
+    """Test /v1/ready endpoint - Gates traffic on background initialization"""
+
+    @pytest.mark.unit
+    def test_ready_unavailable_while_initializing(self):
+        """Readiness should fail until services have initialized"""
+        from app.main import app
+
+        # No lifespan, so background initialization never runs
+        with patch("app.api.v1.health._services_ready", False):
+            response = TestClient(app).get("/v1/ready")
+
+        assert response.status_code == 503
+
+    @pytest.mark.unit
+    def test_ready_after_initialization(self, client):
+        """Readiness should succeed once services have initialized"""
+        with patch("app.api.v1.health._services_ready", True):
+            response = client.get("/v1/ready")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
+
+
 class TestRootEndpoint:
     """Test root endpoint - API information"""
 
@@ -152,6 +188,18 @@ class TestOpenAPIEndpoints:
         # Should return HTML (might redirect)
         assert response.status_code in [200, 307]
 
+    @pytest.mark.unit
+    def test_routes_registered_once(self):
+        """Each path and method should be handled by exactly one route"""
+        from app.main import app
+
+        seen = set()
+        for route in app.routes:
+            for method in getattr(route, "methods", None) or {None}:
+                key = (route.path, method)
+                assert key not in seen, f"Duplicate route: {method} {route.path}"
+                seen.add(key)
+
 
 class TestApplicationLifecycle:
     """Test application startup and shutdown behavior"""
@@ -210,6 +258,19 @@ class TestRequestTracking:
         assert id2 is not None
         assert id1 != id2
 
+    @pytest.mark.unit
+    def test_request_id_on_cors_preflight(self, client):
+        """Preflight responses answered by CORS should also carry a request ID"""
+        response = client.options(
+            "/health",
+            headers={
+                "Origin": "http://localhost:3000",
+                "Access-Control-Request-Method": "GET",
+            }
+        )
+
+        assert "x-request-id" in response.headers
+
 
 class TestCORSConfiguration:
     """Test CORS headers for cross-origin requests"""
@@ -405,6 +405,18 @@ class TestWarnings:
         assert len(response.warnings) > 0
         assert any("invalid" in warning.lower() for warning in response.warnings)
 
+    def test_article_number_validation(self):
+        """Test which article number formats are flagged"""
+        orchestrator = Orchestrator()
+        articles = [
+            Mock(article_number=number)
+            for number in ["1", "168", "309", "166.1.ა", "81-1", "310", "999", "abc", ""]
+        ]
+
+        warnings = orchestrator._check_tax_warnings(articles)
+
+        assert warnings == ["Some citations may be invalid: ['310', '999', 'abc', '']"]
+
 
 class TestKeywordMatching:
     """Test keyword matching utilities"""
@@ -429,3 +441,57 @@ class TestKeywordMatching:
 
         # Should match despite case differences
         assert len(matched) > 0
+
+
+class TestQueryStreaming:
+    """Test streamed query routing"""
+
+    @pytest.mark.asyncio
+    async def test_route_query_stream_tax(self):
+        """Test tax answers are streamed chunk by chunk"""
+        from app.models import TaxResponse
+
+        async def query_stream(question, conversation_history=None):
+            yield "დღგ-ს განაკვეთი "
+            yield "არის 18%"
+            yield TaxResponse(
+                answer="დღგ-ს განაკვეთი არის 18%",
+                cited_articles=[CitedArticle(article_number="166")],
+                confidence=0.9,
+                model_used="test-model",
+                processing_time_ms=1
+            )
+
+        tax_service = Mock()
+        tax_service.query_stream = query_stream
+        orchestrator = Orchestrator(tax_service=tax_service)
+
+        items = [
+            item async for item in orchestrator.route_query_stream(
+                message="რა არის დღგ-ს განაკვეთი?",
+                mode=QueryMode.TAX
+            )
+        ]
+
+        assert items[:2] == ["დღგ-ს განაკვეთი ", "არის 18%"]
+        response = items[-1]
+        assert isinstance(response, UnifiedResponse)
+        assert response.answer == "დღგ-ს განაკვეთი არის 18%"
+        assert response.citations_verified is True
+
+    @pytest.mark.asyncio
+    async def test_route_query_stream_non_streaming_mode(self):
+        """Test modes without streaming yield the whole answer once"""
+        dispute_service = Mock()
+        dispute_service.query = AsyncMock(return_value=Mock(answer="გადაწყვეტილება", cases=[]))
+        orchestrator = Orchestrator(dispute_service=dispute_service)
+
+        items = [
+            item async for item in orchestrator.route_query_stream(
+                message="საჩივარი",
+                mode=QueryMode.DISPUTE
+            )
+        ]
+
+        assert items[0] == "გადაწყვეტილება"
+        assert items[1].mode_used == QueryMode.DISPUTE
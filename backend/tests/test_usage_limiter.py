@@ -0,0 +1,207 @@
+"""
+Tests for the in-process usage limiter
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from app.services.usage_limiter import UsageLimiter
+
+
+def make_session(user):
+    """Create a mock session whose user lookup returns the given user"""
+    result = Mock()
+    result.scalar_one_or_none.return_value = user
+    session = Mock()
+    session.execute = AsyncMock(return_value=result)
+    return session
+
+
+def make_user(daily=0, monthly=0, daily_reset_at=None):
+    """Create a user row stand-in"""
+    now = datetime.utcnow()
+    return Mock(
+        email="user@example.com",
+        daily_requests_count=daily,
+        daily_requests_reset_at=daily_reset_at or now,
+        monthly_requests_count=monthly,
+        monthly_requests_reset_at=now,
+        total_requests_count=monthly,
+    )
+
+
+class TestUsageLimiter:
+    """Test usage limit checks"""
+
+    @pytest.mark.asyncio
+    async def test_loads_user_once(self):
+        """Test counters are loaded once and then kept in memory"""
+        limiter = UsageLimiter()
+        session = make_session(make_user(daily=2, monthly=5))
+
+        for _ in range(3):
+            allowed, _, usage = await limiter.check_and_increment(session, "u1", "/v1/chat")
+            assert allowed
+
+        assert usage == (5, 8)
+        assert session.execute.await_count == 1
+        assert limiter.get_status()["pending_records"] == 3
+
+    @pytest.mark.asyncio
+    async def test_daily_limit(self, monkeypatch):
+        """Test concurrent requests can't exceed the daily limit"""
+        from app.services import usage_limiter
+        monkeypatch.setattr(usage_limiter.settings, "daily_request_limit", 3)
+        limiter = UsageLimiter()
+        session = make_session(make_user())
+
+        results = await asyncio.gather(*(
+            limiter.check_and_increment(session, "u1", "/v1/chat") for _ in range(5)
+        ))
+
+        assert [allowed for allowed, _, _ in results].count(True) == 3
+        assert results[-1][1] == "Daily request limit reached"
+
+    @pytest.mark.asyncio
+    async def test_daily_reset(self):
+        """Test daily counter resets after a day"""
+        limiter = UsageLimiter()
+        user = make_user(daily=50, daily_reset_at=datetime.utcnow() - timedelta(days=1))
+
+        allowed, _, usage = await limiter.check_and_increment(make_session(user), "u1", "/v1/chat")
+
+        assert allowed
+        assert usage == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_unknown_user(self):
+        """Test unknown users are rejected"""
+        limiter = UsageLimiter()
+
+        allowed, reason, _ = await limiter.check_and_increment(make_session(None), "u1", "/v1/chat")
+
+        assert not allowed
+        assert reason == "User not found"
+
+
+class TestUsageFlush:
+    """Test flushing counters to a shared database"""
+
+    @pytest.fixture
+    async def session_factory(self, monkeypatch):
+        """Point the limiter at a fresh in-memory SQLite database with one user"""
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import StaticPool
+
+        from app.db import database
+        from app.db.models import Base, User
+
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=StaticPool,
+            connect_args={"check_same_thread": False},
+        )
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        now = datetime.utcnow()
+        async with factory() as session:
+            session.add(User(
+                id="u1",
+                email="user@example.com",
+                password_hash="x",
+                daily_requests_reset_at=now,
+                monthly_requests_reset_at=now,
+            ))
+            await session.commit()
+
+        monkeypatch.setattr(database, "AsyncSessionLocal", factory)
+        yield factory
+        await engine.dispose()
+
+    async def _stored_counts(self, factory):
+        from sqlalchemy import select
+
+        from app.db.models import User
+
+        async with factory() as session:
+            result = await session.execute(
+                select(User.daily_requests_count, User.total_requests_count)
+            )
+            return tuple(result.one())
+
+    @pytest.mark.asyncio
+    async def test_processes_add_to_shared_counts(self, session_factory):
+        """Test two limiters (processes) add up instead of overwriting each other"""
+        first, second = UsageLimiter(), UsageLimiter()
+
+        async with session_factory() as session:
+            for _ in range(2):
+                await first.check_and_increment(session, "u1", "/v1/chat")
+            for _ in range(3):
+                await second.check_and_increment(session, "u1", "/v1/chat")
+
+        await first.flush()
+        await second.flush()
+
+        assert await self._stored_counts(session_factory) == (5, 5)
+        # The second limiter picked up the first one's requests
+        allowed, _, usage = await second.check_and_increment(None, "u1", "/v1/chat")
+        assert allowed
+        assert usage == (6, 6)
+
+    @pytest.mark.asyncio
+    async def test_flush_keeps_external_reset(self, session_factory):
+        """Test an admin reset in the database isn't undone by the next flush"""
+        from sqlalchemy import update
+
+        from app.db.models import User
+
+        limiter = UsageLimiter()
+        async with session_factory() as session:
+            for _ in range(4):
+                await limiter.check_and_increment(session, "u1", "/v1/chat")
+        await limiter.flush()
+
+        async with session_factory() as session:
+            await session.execute(update(User).values(daily_requests_count=0))
+            await session.commit()
+
+        await limiter.check_and_increment(None, "u1", "/v1/chat")
+        await limiter.flush()
+
+        assert await self._stored_counts(session_factory) == (1, 5)
+
+    @pytest.mark.asyncio
+    async def test_flush_user_leaves_other_users_pending(self, session_factory):
+        """Test flushing one user doesn't write other users' counters"""
+        from app.db.models import User
+
+        now = datetime.utcnow()
+        async with session_factory() as session:
+            session.add(User(
+                id="u2",
+                email="other@example.com",
+                password_hash="x",
+                daily_requests_reset_at=now,
+                monthly_requests_reset_at=now,
+            ))
+            await session.commit()
+
+        limiter = UsageLimiter()
+        async with session_factory() as session:
+            for user_id in ("u1", "u1", "u2"):
+                await limiter.check_and_increment(session, user_id, "/v1/chat")
+
+        await limiter.flush_user("u1")
+
+        async with session_factory() as session:
+            u1 = await session.get(User, "u1")
+            u2 = await session.get(User, "u2")
+        assert u1.daily_requests_count == 2
+        assert u2.daily_requests_count == 0
+        assert limiter.get_status()["pending_records"] == 1